@@ -1,6 +1,8 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, AIMessage
 import uuid
 
 from models import ChatRequest, ChatResponse
@@ -18,10 +20,29 @@ if project_root not in sys.path:
 from utils.logger import get_api_logger
 logger = get_api_logger()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm shared resources at startup and release them at shutdown.
+
+    The MQ tools already share one httpx client and a cached qmgr-dump
+    dataframe; creating both here means the first chat request doesn't pay
+    the TLS handshake or the CSV parse, and the pool closes cleanly instead
+    of being dropped mid-request on shutdown.
+    """
+    from server.mqmcpserver import get_http_client, load_csv
+    app.state.http_client = get_http_client()
+    load_csv()
+    logger.info("Startup complete — shared MQ HTTP client and CSV cache warmed")
+    yield
+    await app.state.http_client.aclose()
+
+
 app = FastAPI(
     title="IBM MQ AI Gateway",
     description="A UI-agnostic REST API for interacting with IBM MQ via LangGraph and LLMs.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Enable CORS for frontend applications (React, Angular, UI testing apps)
@@ -69,7 +90,6 @@ async def chat(request: ChatRequest):
         reply_mgs, tools_used = await process_chat(history, session_id=session_id)
         
         # Assuming the AI responded, store the final AI message too
-        from langchain_core.messages import AIMessage
         history.append(AIMessage(content=reply_mgs))
         
         # Save back to memory
@@ -16,15 +16,15 @@ from server.mqmcpserver import (
 )
 
 @tool
-def find_mq_object(search_string: str, object_type: str | None = None) -> str:
+async def find_mq_object(search_string: str, object_type: str | None = None) -> str:
     """Search QM dump for a string (Queue Name, Channel Name) to find which Queue Manager hosts an object.
     You MUST run this tool first if you do not know which Queue Manager hosts a specific queue or channel.
-    
+
     Args:
         search_string: String to search (e.g., 'QL.IN.APP1')
         object_type: Optional filter (e.g., 'QLOCAL', 'QUEUES', 'CHANNEL')
     """
-    return _find_mq_object(search_string, object_type)
+    return await _find_mq_object(search_string, object_type)
 
 @tool
 async def dspmq(qmgr_name: str | None = None) -> str:
@@ -1,7 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
 
 class ChatRequest(BaseModel):
+    # Pydantic v2 validates in Rust; forbidding extras keeps the decode path
+    # on the fast branch (no extra-field collection) and rejects junk early.
+    model_config = ConfigDict(extra="forbid")
+
     session_id: str
     message: str
 
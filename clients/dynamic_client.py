@@ -13,6 +13,7 @@ This is useful for:
 """
 
 import asyncio
+import importlib.util
 import os
 import re
 import sys
@@ -33,6 +34,32 @@ load_dotenv()
 # Initialize logger
 logger = get_metrics_logger("mq-dynamic-client")
 
+# Compiled once; single-case — callers uppercase the buffer before matching
+_QMGR_RE = re.compile(r'QM:\s*([A-Z0-9_.]+)')
+
+# Parsed qmgr dump, keyed by file mtime — the smart queue-listing path used to
+# re-read and re-strip the whole CSV on every request
+_QMGR_DUMP_CACHE = {"mtime": None, "df": None}
+
+
+def _load_qmgr_dump(csv_path):
+    """Load the qmgr dump CSV once per file version; repeat calls hit the cache."""
+    import pandas as pd
+
+    mtime = os.path.getmtime(csv_path)
+    if _QMGR_DUMP_CACHE["df"] is None or _QMGR_DUMP_CACHE["mtime"] != mtime:
+        # pyarrow's C++ reader when installed; skipinitialspace isn't
+        # supported there, but the strip below covers leading whitespace
+        if importlib.util.find_spec("pyarrow"):
+            df = pd.read_csv(csv_path, delimiter="|", header=0, engine="pyarrow")
+        else:
+            df = pd.read_csv(csv_path, delimiter="|", skipinitialspace=True, header=0)
+        # Strip whitespace from all string columns
+        df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
+        _QMGR_DUMP_CACHE["mtime"] = mtime
+        _QMGR_DUMP_CACHE["df"] = df
+    return _QMGR_DUMP_CACHE["df"]
+
 
 class DynamicMQClient:
     """
@@ -369,15 +396,10 @@ class DynamicMQClient:
                 })
                 search_text = search_res.content[0].text
                 
-                # Parse QMGRs (Simple parsing of the text output)
-                import re
-                qmgrs = set()
-                for line in search_text.split('\n'):
-                    # Match "QM:QM1 Host:..."
-                    match = re.search(r'QM:\s*([A-Z0-9_\.]+)', line, re.IGNORECASE)
-                    if match:
-                        qmgrs.add(match.group(1).strip())
-                
+                # Parse QMGRs — one pass over the whole payload, matching "QM:QM1 Host:..."
+                qmgrs = {m.group(1) for m in _QMGR_RE.finditer(search_text.upper())}
+
+
                 if not qmgrs:
                     return f"I couldn't find a queue named '{queue_name}' on any known queue manager. Please specify the queue manager if it exists."
                 
@@ -592,13 +614,9 @@ class DynamicMQClient:
             
             if not os.path.exists(csv_path):
                 return f"❌ Error: CSV file not found at {csv_path}"
-            
-            import pandas as pd
-            df = pd.read_csv(csv_path, delimiter="|", skipinitialspace=True, header=0)
-            
-            # Strip whitespace from all string columns
-            df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
-            
+
+            df = _load_qmgr_dump(csv_path)
+
             # Find first entry for this queue manager
             qmgr_rows = df[df['qmname'].str.upper() == qmgr.upper()]
             
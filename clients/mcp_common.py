@@ -0,0 +1,117 @@
+"""
+Shared helpers for the stdio-backed Streamlit clients.
+
+streamlit_basic_client and streamlit_guided_client carried identical copies
+of the command runner and the connectivity probe; importing them from here
+keeps one parsed/compiled copy per process instead of one per entry point.
+
+The runner keeps one connected DynamicMQClient per server script in session
+state — connecting spawns the MCP server as a subprocess and runs the full
+initialize handshake, so paying that per prompt dominated every click.
+"""
+
+import asyncio
+import atexit
+import builtins
+
+import streamlit as st
+
+from dynamic_client import DynamicMQClient
+
+
+def get_event_loop():
+    """
+    Get or create a long-lived event loop for this Streamlit session.
+
+    asyncio.run() tears down its loop when it returns, which would kill the
+    cached stdio client bound to it; one persistent loop keeps the MCP
+    subprocess and session alive across reruns.
+    """
+    loop = st.session_state.get("event_loop")
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        st.session_state.event_loop = loop
+    return loop
+
+
+def run_async(coro):
+    """Run a coroutine on the session's persistent event loop."""
+    return get_event_loop().run_until_complete(coro)
+
+
+async def _get_client(server_script) -> DynamicMQClient:
+    """Return the cached connected client for this server script, connecting lazily."""
+    clients = st.session_state.setdefault("mcp_clients", {})
+    client = clients.get(server_script)
+    if client is None:
+        client = DynamicMQClient(server_script=server_script)
+        await client.connect()
+        clients[server_script] = client
+    return client
+
+
+async def run_mcp_command(server_script, prompt, show_tool_call=None):
+    """Run one prompt against the shared MCP client and return (response, usage)."""
+    try:
+        client = await _get_client(server_script)
+        original_input = builtins.input
+        original_log = client._log_tool_call
+        builtins.input = lambda _: ""
+        try:
+            # Monkey-patch the client's _log_tool_call to also display in UI
+            if show_tool_call:
+                def new_log(tool_name, args):
+                    original_log(tool_name, args)
+                    show_tool_call(tool_name, args)
+                client._log_tool_call = new_log
+
+            response, usage = await client.handle_user_input(prompt)
+            return response, usage
+        finally:
+            builtins.input = original_input
+            client._log_tool_call = original_log
+    except Exception as e:
+        # The subprocess/session may be wedged — drop it so the next prompt reconnects
+        stale = st.session_state.get("mcp_clients", {}).pop(server_script, None)
+        if stale is not None:
+            try:
+                await stale.disconnect()
+            except Exception:
+                pass
+        return f"❌ Error: {str(e)}", {}
+
+
+def run_mcp_command_sync(server_script, prompt, show_tool_call=None):
+    """Synchronous wrapper driving run_mcp_command on the persistent loop."""
+    return run_async(run_mcp_command(server_script, prompt, show_tool_call))
+
+
+def probe_mcp_status(server_script):
+    """Run a quick dspmq and return the status badge HTML for the top nav."""
+    try:
+        res, _ = run_mcp_command_sync(server_script, "dspmq")
+        if "❌" in res:
+            return '<span style="color: #ff9999;">🔴 MCP Offline</span>'
+        return '<span style="color: #ccffcc;">🟢 MCP Online</span>'
+    except Exception:
+        return '<span style="color: #ff9999;">🔴 MCP Error</span>'
+
+
+def cleanup_on_exit():
+    """Disconnect cached MCP clients on interpreter exit — best effort."""
+    try:
+        loop = st.session_state.get("event_loop")
+        for client in st.session_state.get("mcp_clients", {}).values():
+            try:
+                if loop is not None and not loop.is_closed():
+                    loop.run_until_complete(client.disconnect())
+                else:
+                    asyncio.run(client.disconnect())
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+
+atexit.register(cleanup_on_exit)
@@ -12,13 +12,81 @@ Import example:
 from __future__ import annotations
 from typing import Any
 
+# Schemas ride along on every LLM request, so trim the parts the model
+# doesn't need to emit valid arguments.
+_MAX_DESCRIPTION_LEN = 100
+
+
+def _collect_refs(node: Any, refs: set[str]) -> None:
+    """Gather every "$ref": "#/$defs/<name>" target reachable from node."""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            refs.add(ref.split("/")[-1])
+        for value in node.values():
+            _collect_refs(value, refs)
+    elif isinstance(node, list):
+        for item in node:
+            _collect_refs(item, refs)
+
+
+def _prune_node(node: Any) -> Any:
+    if isinstance(node, dict):
+        pruned = {}
+        for key, value in node.items():
+            if key == "examples":
+                continue
+            if key == "description" and isinstance(value, str) and len(value) > _MAX_DESCRIPTION_LEN:
+                value = value[:_MAX_DESCRIPTION_LEN].rstrip() + "…"
+            pruned[key] = _prune_node(value)
+        if pruned.get("type") == "object":
+            pruned.setdefault("additionalProperties", False)
+        return pruned
+    if isinstance(node, list):
+        return [_prune_node(item) for item in node]
+    return node
+
+
+def prune_input_schema(schema: dict) -> dict:
+    """
+    Return a token-lean copy of an MCP inputSchema for LLM tool definitions.
+
+    Drops "examples" blocks and unreferenced $defs, trims long property
+    descriptions, and marks objects "additionalProperties": false so the
+    model emits minimal argument JSON. The original schema is not mutated.
+    """
+    pruned = _prune_node(schema)
+    defs = pruned.get("$defs")
+    if isinstance(defs, dict):
+        used: set[str] = set()
+        _collect_refs({k: v for k, v in pruned.items() if k != "$defs"}, used)
+        # $defs can reference each other; chase until the used set settles
+        pending = set(used)
+        while pending:
+            name = pending.pop()
+            if name in defs:
+                before = set(used)
+                _collect_refs(defs[name], used)
+                pending |= used - before
+        kept = {name: defs[name] for name in defs if name in used}
+        if kept:
+            pruned["$defs"] = kept
+        else:
+            del pruned["$defs"]
+    return pruned
+
 
 def to_openai_schema(mcp_tools: list) -> list[dict]:
-    """Convert a list of MCP Tool objects to OpenAI function-calling format."""
+    """Convert a list of MCP Tool objects to OpenAI function-calling format.
+
+    Schemas are pruned via prune_input_schema — callers cache the converted
+    list (e.g. st.session_state.openai_tools), so the walk runs once per
+    tool refresh, not per request.
+    """
     result = []
     for tool in mcp_tools:
         parameters = (
-            tool.inputSchema
+            prune_input_schema(tool.inputSchema)
             if hasattr(tool, "inputSchema") and tool.inputSchema
             else {"type": "object", "properties": {}}
         )
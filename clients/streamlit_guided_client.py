@@ -1,7 +1,6 @@
 import streamlit as st
-import asyncio
 import os
-from dynamic_client import DynamicMQClient
+from mcp_common import probe_mcp_status, run_mcp_command_sync
 from tool_logger import display_tool_call
 
 # Set up page config
@@ -11,41 +10,12 @@ st.set_page_config(page_title="IBM MQ Guided Assistant", page_icon="🛠️", la
 script_dir = os.path.dirname(os.path.abspath(__file__))
 SERVER_SCRIPT = os.path.join(script_dir, "..", "server", "mqmcpserver.py")
 
-async def run_mcp_command(prompt, show_tool_call=None):
-    """Execution logic from basic client"""
-    client = DynamicMQClient(server_script=SERVER_SCRIPT)
-    try:
-        await client.connect()
-        import builtins
-        original_input = builtins.input
-        builtins.input = lambda _: ""
-        try:
-            # Monkey-patch the client's _log_tool_call to also display in UI
-            if show_tool_call:
-                original_log = client._log_tool_call
-                def new_log(tool_name, args):
-                    original_log(tool_name, args)
-                    show_tool_call(tool_name, args)
-                client._log_tool_call = new_log
-            
-            response, usage = await client.handle_user_input(prompt)
-            return response, usage
-        finally:
-            builtins.input = original_input
-            await client.disconnect()
-    except Exception as e:
-        return f"❌ Error: {str(e)}", {}
+def run_mcp_command(prompt, show_tool_call=None):
+    """Run one prompt against this page's shared, persistent MCP client."""
+    return run_mcp_command_sync(SERVER_SCRIPT, prompt, show_tool_call)
 
 # Connectivity Check logic
-mcp_status_html = '<span style="color: #ffcccc;">🔘 Checking...</span>'
-try:
-    res, _ = asyncio.run(run_mcp_command("dspmq"))
-    if "❌" in res:
-        mcp_status_html = '<span style="color: #ff9999;">🔴 MCP Offline</span>'
-    else:
-        mcp_status_html = '<span style="color: #ccffcc;">🟢 MCP Online</span>'
-except:
-    mcp_status_html = '<span style="color: #ff9999;">🔴 MCP Error</span>'
+mcp_status_html = probe_mcp_status(SERVER_SCRIPT)
 
 
 # CUSTOM CSS & GLOBAL UI COMPONENTS
@@ -230,7 +200,7 @@ with st.container(border=True):
                 
                 with st.status("Executing Command...", expanded=True) as status:
                     st.write(f"Connecting to IBM MQ...")
-                    response, usage = asyncio.run(run_mcp_command(final_prompt, show_tool_call=display_tool_call))
+                    response, usage = run_mcp_command(final_prompt, show_tool_call=display_tool_call)
                     status.update(label="Run Complete!", state="complete", expanded=False)
                 
                 with st.chat_message("assistant"):
@@ -240,7 +210,7 @@ with st.container(border=True):
             elif not config.get("inputs"):
                 with st.chat_message("assistant"):
                     with st.spinner("Executing..."):
-                        response, usage = asyncio.run(run_mcp_command(config["prompt"], show_tool_call=display_tool_call))
+                        response, usage = run_mcp_command(config["prompt"], show_tool_call=display_tool_call)
                         st.markdown(response)
                         if usage:
                             st.caption(f"📊 Tokens: {usage.get('total_tokens', 0)} (Prompt: {usage.get('prompt_tokens', 0)}, Completion: {usage.get('completion_tokens', 0)})")
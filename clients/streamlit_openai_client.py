@@ -6,7 +6,7 @@ import signal
 import atexit
 from llm_client import LLMToolCaller
 from dotenv import load_dotenv
-from tool_logger import get_rest_api_url, should_show_logging
+from tool_logger import render_tools_used, should_show_logging
 from metrics_logger import get_metrics_logger
 
 # Load environment variables
@@ -15,26 +15,18 @@ logger = get_metrics_logger("mq-streamlit-openai")
 
 # Cleanup handler for graceful shutdown
 def cleanup_on_exit():
-    """Cleanup resources on exit - non-blocking"""
-    import threading
-    
-    def do_cleanup():
-        try:
-            if hasattr(st, 'session_state'):
-                for key in list(st.session_state.keys()):
-                    obj = st.session_state.get(key)
-                    if obj and hasattr(obj, 'cleanup'):
-                        try:
-                            obj.cleanup()
-                        except:
-                            pass
-        except:
-            pass
-    
-    # Run cleanup in background thread (daemon) with short timeout
-    t = threading.Thread(target=do_cleanup, daemon=True)
-    t.start()
-    t.join(timeout=1)  # Wait max 1 second
+    """Cleanup resources on exit - best effort"""
+    try:
+        if hasattr(st, 'session_state'):
+            for key in list(st.session_state.keys()):
+                obj = st.session_state.get(key)
+                if obj and hasattr(obj, 'cleanup'):
+                    try:
+                        obj.cleanup()
+                    except:
+                        pass
+    except:
+        pass
 
 # Register only atexit handler - don't override Streamlit's signal handlers
 atexit.register(cleanup_on_exit)
@@ -303,26 +295,7 @@ for message in st.session_state.messages_llm:
 
         # Display tools used if available
         if "tools_used" in message and message["tools_used"] and should_show_logging():
-            with st.expander("🔧 Tools Used (in order)"):
-                for idx, tool in enumerate(message["tools_used"], 1):
-                    col1, col2 = st.columns([1, 4])
-                    with col1:
-                        st.markdown(f"**Step {idx}**")
-                    with col2:
-                        st.markdown(f"**`{tool['name']}`**")
-                    
-                    if tool.get('args'):
-                        st.json(tool['args'], expanded=False)
-                    
-                    # Show REST endpoint if logging is enabled
-                    if should_show_logging():
-                        rest_endpoint = get_rest_api_url(tool['name'], tool.get('args', {}))
-                        st.code(rest_endpoint, language="text")
-                
-                # Show token usage inside expander
-                if "usage" in message and message["usage"]:
-                    st.divider()
-                    st.caption(f"📊 **Token Usage:** {message['usage'].get('total_tokens', 0)} total ({message['usage'].get('prompt_tokens', 0)} prompt, {message['usage'].get('completion_tokens', 0)} completion)")
+            render_tools_used(message["tools_used"], message.get("usage"))
 
 # User input
 if prompt := st.chat_input("Ask something about IBM MQ..."):
@@ -379,26 +352,9 @@ if prompt := st.chat_input("Ask something about IBM MQ..."):
 
             # Display tools used
             if tools_used and should_show_logging():
-                with tools_placeholder.expander("🔧 Tools Used by AI (in order)"):
-                    for idx, tool in enumerate(tools_used, 1):
-                        col1, col2 = st.columns([1, 4])
-                        with col1:
-                            st.markdown(f"**Step {idx}**")
-                        with col2:
-                            st.markdown(f"**`{tool['name']}`**")
-                        
-                        if tool.get('args'):
-                            st.json(tool['args'], expanded=False)
-                        
-                        # Show REST endpoint if logging is enabled
-                        if should_show_logging():
-                            rest_endpoint = get_rest_api_url(tool['name'], tool.get('args', {}))
-                            st.code(rest_endpoint, language="text")
-                    
-                    # Show token usage inside expander
-                    if usage:
-                        st.divider()
-                        st.caption(f"📊 **Token Usage:** {usage.get('total_tokens', 0)} total ({usage.get('prompt_tokens', 0)} prompt, {usage.get('completion_tokens', 0)} completion)")
+                render_tools_used(tools_used, usage,
+                                  title="🔧 Tools Used by AI (in order)",
+                                  container=tools_placeholder)
         
         # Add assistant response to chat history with tools used
         st.session_state.messages_llm.append({
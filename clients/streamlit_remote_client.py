@@ -1,37 +1,75 @@
 import streamlit as st
 import asyncio
+import atexit
 import os
-import json
+import time
+
+import orjson
 from dotenv import load_dotenv
-from tool_logger import get_rest_api_url, should_show_logging
+from tool_logger import render_tools_used, should_show_logging
 from metrics_logger import get_metrics_logger
 from mq_tools.converters import to_openai_schema, to_anthropic_schema, to_gemini_declarations
 from mq_tools.prompts import MQ_SYSTEM_PROMPT
 
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+# Heavy SDKs (openai ~200ms, mcp, anthropic, google.generativeai) are
+# imported lazily inside the functions that use them so the first page
+# paint doesn't wait on stacks the user may never touch. find_spec only
+# reads package metadata — it doesn't execute the module.
+import importlib.util
+
+HAS_OPENAI = importlib.util.find_spec("openai") is not None
+HAS_ANTHROPIC = importlib.util.find_spec("anthropic") is not None
+HAS_GEMINI = importlib.util.find_spec("google.generativeai") is not None
+
+
+def _mcp_http_client_factory(headers=None, timeout=None, auth=None):
+    """
+    Build the httpx client the MCP SSE transport runs over.
+
+    Keep-alive pooling (and HTTP/2 multiplexing where the server speaks it)
+    lets the asyncio.gather tool fan-out share one connection instead of
+    opening a TCP socket per concurrent request.
+    """
+    import httpx
+    if timeout is None:
+        timeout = httpx.Timeout(30.0, read=300.0)
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout,
+        auth=auth,
+        follow_redirects=True,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
 
-try:
-    import anthropic as anthropic_sdk
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
 
-try:
-    import google.generativeai as genai
-    HAS_GEMINI = True
-except ImportError:
-    HAS_GEMINI = False
+def _sse_client_kwargs(sse_client_fn):
+    """Inject the pooled-client factory only when the installed SDK supports it."""
+    import inspect
+    if "httpx_client_factory" in inspect.signature(sse_client_fn).parameters:
+        return {"httpx_client_factory": _mcp_http_client_factory}
+    return {}
 
-from mcp.client.sse import sse_client
 
 # Load environment variables
 load_dotenv()
 logger = get_metrics_logger("mq-streamlit-remote")
 
+# Cleanup handler for graceful shutdown — close any cached MCP sessions
+def cleanup_on_exit():
+    """Close cached MCP sessions on exit - best effort"""
+    try:
+        managers = st.session_state.get("mcp_session_managers", {})
+        for manager in managers.values():
+            try:
+                asyncio.run(manager.aclose())
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+atexit.register(cleanup_on_exit)
+
 # Set up page config
 st.set_page_config(page_title="IBM MQ Remote AI Assistant", page_icon="🌐", layout="wide")
 
@@ -55,115 +93,482 @@ if "messages_remote" not in st.session_state:
 if "mcp_tools" not in st.session_state:
     st.session_state.mcp_tools = []
 
+def get_event_loop():
+    """
+    Get or create a long-lived event loop for this Streamlit session.
+
+    asyncio.run() creates and tears down a fresh loop per call, which also
+    destroys any async resources bound to it — including the cached MCP
+    session. One persistent loop keeps that session alive across reruns.
+    """
+    loop = st.session_state.get("event_loop")
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        st.session_state.event_loop = loop
+    return loop
+
+
+def run_async(coro):
+    """Run a coroutine on the session's persistent event loop."""
+    return get_event_loop().run_until_complete(coro)
+
+
+class MCPSessionManager:
+    """
+    Holds one live sse_client + ClientSession per endpoint.
+
+    Opening an SSE session costs a full connect + initialize handshake, so
+    reconnecting per tool call turns an N-tool AI turn into N handshakes.
+    Caching the session in st.session_state keeps a single connection alive
+    and every call_mcp_tool becomes just session.call_tool().
+    """
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.session = None
+        self._streams_context = None
+        self._session_context = None
+        self._loop = None
+        self._lock = None
+
+    async def get_session(self):
+        """Return the live session, (re)connecting lazily on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A fresh event loop means any previous session died with the old one
+            await self.aclose()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        if self.session is None:
+            async with self._lock:
+                if self.session is None:
+                    await self._connect()
+        return self.session
+
+    async def _connect(self):
+        from mcp import ClientSession
+        from mcp.client.sse import sse_client
+
+        self._streams_context = sse_client(self.endpoint, **_sse_client_kwargs(sse_client))
+        streams = await self._streams_context.__aenter__()
+        self._session_context = ClientSession(streams[0], streams[1])
+        self.session = await self._session_context.__aenter__()
+        await self.session.initialize()
+
+    async def aclose(self):
+        """Tear down the session and streams, ignoring shutdown races."""
+        for context in (self._session_context, self._streams_context):
+            try:
+                if context:
+                    await context.__aexit__(None, None, None)
+            except Exception:
+                pass
+        self.session = None
+        self._session_context = None
+        self._streams_context = None
+
+
+def get_session_manager(endpoint) -> MCPSessionManager:
+    """Fetch (or create) the cached session manager for this endpoint."""
+    managers = st.session_state.setdefault("mcp_session_managers", {})
+    manager = managers.get(endpoint)
+    if manager is None:
+        manager = MCPSessionManager(endpoint)
+        managers[endpoint] = manager
+    return manager
+
+
+async def get_or_create_session(endpoint):
+    """Get the cached MCP session for this endpoint, creating it on first use."""
+    return await get_session_manager(endpoint).get_session()
+
+
+def set_mcp_tools(tools):
+    """Store fetched tools and precompute the OpenAI schema once per fetch."""
+    st.session_state.mcp_tools = tools
+    st.session_state.openai_tools = to_openai_schema(tools) if tools else []
+
+
 async def check_connection(endpoint):
     """Test connection to MCP server"""
+    manager = get_session_manager(endpoint)
+    already_live = manager.session is not None
     try:
-        async with sse_client(endpoint) as streams:
-            async with ClientSession(streams[0], streams[1]) as session:
-                await session.initialize()
-                return True, "Connected"
+        session = await manager.get_session()
+        if already_live:
+            # Don't vouch for a cached session untested — idle proxies drop
+            # SSE streams silently. Ping it; on failure rebuild and re-ping.
+            try:
+                await session.send_ping()
+            except Exception:
+                await manager.aclose()
+                session = await manager.get_session()
+                await session.send_ping()
+        return True, "Connected"
     except Exception as e:
+        await manager.aclose()
         return False, str(e)
 
+# Tool list rarely changes per server version — re-fetching it with a full
+# tools/list round-trip on every turn is pure overhead.
+_TOOLS_CACHE_TTL = 60.0  # seconds
+
 async def get_mcp_tools(endpoint):
-    """Fetch available MCP tools from server"""
+    """Fetch available MCP tools from server (cached per endpoint with a TTL)"""
+    cache = st.session_state.setdefault("mcp_tools_cache", {})
+    cached = cache.get(endpoint)
+    if cached and time.monotonic() - cached[0] < _TOOLS_CACHE_TTL:
+        return cached[1]
     try:
-        async with sse_client(endpoint) as streams:
-            async with ClientSession(streams[0], streams[1]) as session:
-                await session.initialize()
-                tools_response = await session.list_tools()
-                return tools_response.tools
+        session = await get_or_create_session(endpoint)
+        tools_response = await session.list_tools()
+        cache[endpoint] = (time.monotonic(), tools_response.tools)
+        return tools_response.tools
     except Exception as e:
+        # Drop the cached session so the next attempt reconnects cleanly
+        await get_session_manager(endpoint).aclose()
         st.error(f"Failed to fetch tools: {e}")
         return []
 
 async def call_mcp_tool(endpoint, tool_name, arguments):
-    """Call a specific MCP tool via SSE"""
+    """Call a specific MCP tool via the shared SSE session"""
+    manager = get_session_manager(endpoint)
     try:
-        async with sse_client(endpoint) as streams:
-            async with ClientSession(streams[0], streams[1]) as session:
-                await session.initialize()
+        for attempt in (0, 1):
+            try:
+                session = await manager.get_session()
                 result = await session.call_tool(tool_name, arguments)
-                if result.content:
-                    return result.content[0].text
-                return "✅ Command executed (No output)"
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Idle SSE sessions get dropped by proxies; the first call
+                # after a quiet spell then fails on a dead stream. Rebuild
+                # the session and retry once before reporting failure.
+                await manager.aclose()
+                if attempt:
+                    raise
+        if result.content:
+            return result.content[0].text
+        return "✅ Command executed (No output)"
+    except asyncio.CancelledError:
+        await manager.aclose()
+        raise
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
-async def handle_ai_conversation(user_message, endpoint, api_key):
-    """Handle conversation with OpenAI and execute tool calls"""
+# The system prompt is the stable prefix of every request. Building the
+# message dict once at import avoids re-allocating the ~2KB string per call
+# and keeps the prefix byte-identical across rounds so OpenAI's automatic
+# prompt caching can hit on it.
+_SYSTEM_MESSAGE = {"role": "system", "content": MQ_SYSTEM_PROMPT}
+
+
+# ---------------------------------------------------------------------------
+# Chat-history trimming — rolling summary instead of a blind last-10 slice
+# ---------------------------------------------------------------------------
+_HISTORY_KEEP = 6          # raw messages kept verbatim in the prompt
+_SUMMARY_TRIGGER = 12      # unfolded messages before we summarize the older ones
+_TOOL_RESULT_MAX = 2048    # bytes of tool output kept per message
+
+
+def _truncate_tool_result(text):
+    """Clip huge MQSC dumps to head+tail before they enter the transcript."""
+    if not isinstance(text, str) or len(text) <= _TOOL_RESULT_MAX:
+        return text
+    head = text[: _TOOL_RESULT_MAX - 512]
+    tail = text[-512:]
+    return f"{head}\n[... truncated ...]\n{tail}"
+
+
+# Above this size a raw runmqsc/search dump costs more to re-send each round
+# than one cheap extraction call costs once.
+_COMPRESS_THRESHOLD = 1500
+
+
+def _compress_tool_result(client, tool_result, user_question):
+    """
+    Shrink a large tool result to the fields that matter for the question.
+
+    Raw MQSC dumps re-enter the context on every subsequent round of the tool
+    loop, so an N-round turn pays O(N × dump size) tokens. A single gpt-4o-mini
+    extraction pass keeps the loop input compact; the untouched full result is
+    kept separately for the transparency expander. Returns (compact_text,
+    usage) and falls back to plain truncation if the extraction call fails.
+    """
+    try:
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You condense raw IBM MQ tool output. Keep only the lines "
+                        "relevant to the user's question — queue/object names, queue "
+                        "managers, hosts, CURDEPTH/TARGET/STATUS values and any error "
+                        "or [RESTRICTED] text. Plain text, no commentary."
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": f"Question: {user_question}\n\nTool output:\n{tool_result}",
+                },
+            ],
+            max_tokens=300,
+        )
+        compact = (response.choices[0].message.content or "").strip()
+        if compact:
+            return compact, response.usage
+    except Exception:
+        pass
+    return _truncate_tool_result(tool_result), None
+
+
+def _maybe_summarize_history(client, model_name):
+    """
+    Fold messages older than the raw window into a running summary.
+
+    A cheap model call preserves queue names, queue managers, and depths, so
+    follow-up questions still have the facts without carrying full dumps.
+    """
+    history = st.session_state.messages_remote
+    folded = st.session_state.get("history_summary_upto", 0)
+    if len(history) - folded <= _SUMMARY_TRIGGER:
+        return
+    older = [
+        m for m in history[folded:-_HISTORY_KEEP]
+        if m["role"] in ("user", "assistant") and isinstance(m["content"], str)
+    ]
+    if not older:
+        return
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in older)
+    previous = st.session_state.get("history_summary", "")
+    try:
+        response = client.chat.completions.create(
+            model=model_name,
+            messages=[{
+                "role": "user",
+                "content": (
+                    "Summarize this IBM MQ assistant conversation in a few bullet "
+                    "points, preserving queue names, queue manager names, hostnames, "
+                    "and reported depths/statuses.\n\n"
+                    + (f"Previous summary:\n{previous}\n\n" if previous else "")
+                    + f"New messages:\n{transcript}"
+                ),
+            }],
+        )
+        st.session_state.history_summary = response.choices[0].message.content
+        st.session_state.history_summary_upto = len(history) - _HISTORY_KEEP
+    except Exception:
+        # Summarization is best-effort; fall back to the raw window
+        pass
+
+
+def _build_history_messages():
+    """Return prior turns for the prompt: rolling summary + recent raw messages."""
+    messages = []
+    summary = st.session_state.get("history_summary")
+    folded = st.session_state.get("history_summary_upto", 0)
+    if summary:
+        messages.append({
+            "role": "user",
+            "content": f"Summary of the earlier conversation:\n{summary}",
+        })
+    recent = st.session_state.messages_remote[folded:][-_HISTORY_KEEP:]
+    for msg in recent:
+        if msg["role"] in ("user", "assistant") and isinstance(msg["content"], str):
+            messages.append({"role": msg["role"], "content": msg["content"]})
+    return messages
+
+
+@st.cache_resource
+def get_openai_client(api_key):
+    """One OpenAI client per API key — reuses the underlying httpx connection pool."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+def _stream_completion(client, on_update=None, **kwargs):
+    """
+    Consume a streamed chat completion, accumulating text and tool-call
+    fragments (OpenAI splits function arguments across chunks, keyed by index).
+
+    Streaming shows the first token in under a second instead of a blank
+    "thinking" pulse for the whole generation. Returns (assistant_message,
+    usage) where assistant_message is a plain dict ready to append to the
+    transcript.
+    """
+    stream = client.chat.completions.create(
+        stream=True, stream_options={"include_usage": True}, **kwargs
+    )
+    content_parts = []
+    tool_calls = {}
+    usage = None
+    chunks_since_update = 0
+    for chunk in stream:
+        if chunk.usage:
+            usage = chunk.usage
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta is None:
+            continue
+        if delta.content:
+            content_parts.append(delta.content)
+            chunks_since_update += 1
+            if on_update and chunks_since_update >= 10:
+                on_update("".join(content_parts) + " ▌")
+                chunks_since_update = 0
+        for fragment in delta.tool_calls or []:
+            entry = tool_calls.setdefault(
+                fragment.index,
+                {"id": "", "type": "function", "function": {"name": "", "arguments": ""}},
+            )
+            if fragment.id:
+                entry["id"] = fragment.id
+            if fragment.function and fragment.function.name:
+                entry["function"]["name"] += fragment.function.name
+            if fragment.function and fragment.function.arguments:
+                entry["function"]["arguments"] += fragment.function.arguments
+
+    content = "".join(content_parts)
+    if on_update and content:
+        on_update(content)
+    message = {"role": "assistant", "content": content or None}
+    if tool_calls:
+        message["tool_calls"] = [tool_calls[i] for i in sorted(tool_calls)]
+    return message, usage
+
+
+async def handle_ai_conversation(user_message, endpoint, api_key, on_update=None):
+    """Handle conversation with OpenAI and execute tool calls, streaming text as it arrives"""
     if not api_key:
         return None, "Please provide an OpenAI API key in the sidebar."
     if not HAS_OPENAI:
         return None, "❌ openai library not installed."
 
     if not st.session_state.mcp_tools:
-        st.session_state.mcp_tools = await get_mcp_tools(endpoint)
+        set_mcp_tools(await get_mcp_tools(endpoint))
     if not st.session_state.mcp_tools:
         return None, "No MCP tools available. Check your MCP endpoint."
 
-    openai_tools = to_openai_schema(st.session_state.mcp_tools)
-    messages = [{"role": "system", "content": MQ_SYSTEM_PROMPT}]
-    for msg in st.session_state.messages_remote[-10:]:
-        messages.append({"role": msg["role"], "content": msg["content"]})
-    messages.append({"role": "user", "content": user_message})
+    # Converted once in set_mcp_tools — not per prompt
+    openai_tools = st.session_state.get("openai_tools") or to_openai_schema(st.session_state.mcp_tools)
 
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
+        _maybe_summarize_history(client, "gpt-4o-mini")
+        messages = [_SYSTEM_MESSAGE]
+        messages.extend(_build_history_messages())
+        messages.append({"role": "user", "content": user_message})
         tools_used = []
         total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
 
-        model_name = os.getenv("OPENAI_MODEL", "gpt-4")
-        response = client.chat.completions.create(
+        model_name = st.session_state.get("openai_model") or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+        def _add_usage(usage):
+            if usage:
+                total_usage["prompt_tokens"] += usage.prompt_tokens
+                total_usage["completion_tokens"] += usage.completion_tokens
+                total_usage["total_tokens"] += usage.total_tokens
+
+        response_message, usage = _stream_completion(
+            client,
+            on_update=on_update,
             model=model_name,
             messages=messages,
             tools=openai_tools,
             tool_choice="auto",
         )
-        
-        if hasattr(response, 'usage') and response.usage:
-            total_usage["prompt_tokens"] += response.usage.prompt_tokens
-            total_usage["completion_tokens"] += response.usage.completion_tokens
-            total_usage["total_tokens"] += response.usage.total_tokens
+        _add_usage(usage)
 
-        response_message = response.choices[0].message
+        # Each round costs a full completion plus N MCP calls — cap the loop
+        # so a misbehaving prompt can't spin indefinitely.
+        max_tool_rounds = 8
+        rounds = 0
 
-        while response_message.tool_calls:
+        while response_message.get("tool_calls") and rounds < max_tool_rounds:
+            rounds += 1
             messages.append(response_message)
-            for tool_call in response_message.tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-                tools_used.append({"name": function_name, "args": function_args})
-                tool_result = await call_mcp_tool(endpoint, function_name, function_args)
+            # The system prompt pushes the model to query multiple queue
+            # managers per turn — run those independent calls concurrently
+            # over the shared SSE session instead of stacking latencies.
+            parsed_calls = [
+                (tool_call, orjson.loads(tool_call["function"]["arguments"]))
+                for tool_call in response_message["tool_calls"]
+            ]
+            # Models occasionally repeat the exact same call within one turn;
+            # key on (name, sorted args) so duplicates share one MCP round-trip
+            # while each tool_call_id still gets its own transcript entry.
+            def _call_key(tool_call, function_args):
+                return (tool_call["function"]["name"],
+                        orjson.dumps(function_args, option=orjson.OPT_SORT_KEYS))
+
+            pending = {}
+            for tool_call, function_args in parsed_calls:
+                key = _call_key(tool_call, function_args)
+                if key not in pending:
+                    pending[key] = asyncio.ensure_future(
+                        call_mcp_tool(endpoint, tool_call["function"]["name"], function_args)
+                    )
+            await asyncio.gather(*pending.values())
+            for tool_call, function_args in parsed_calls:
+                function_name = tool_call["function"]["name"]
+                tool_result = pending[_call_key(tool_call, function_args)].result()
+                used_entry = {"name": function_name, "args": function_args}
+                if isinstance(tool_result, str) and len(tool_result) > _COMPRESS_THRESHOLD:
+                    content, usage = _compress_tool_result(client, tool_result, user_message)
+                    _add_usage(usage)
+                    # Full dump stays available for the transparency log
+                    used_entry["full_result"] = tool_result
+                else:
+                    content = _truncate_tool_result(tool_result)
+                tools_used.append(used_entry)
                 messages.append({
                     "role": "tool",
-                    "tool_call_id": tool_call.id,
+                    "tool_call_id": tool_call["id"],
                     "name": function_name,
-                    "content": tool_result,
+                    "content": content,
                 })
-            response = client.chat.completions.create(
+            response_message, usage = _stream_completion(
+                client,
+                on_update=on_update,
                 model=model_name,
                 messages=messages,
                 tools=openai_tools,
                 tool_choice="auto",
             )
-            
-            if hasattr(response, 'usage') and response.usage:
-                total_usage["prompt_tokens"] += response.usage.prompt_tokens
-                total_usage["completion_tokens"] += response.usage.completion_tokens
-                total_usage["total_tokens"] += response.usage.total_tokens
+            _add_usage(usage)
 
-            response_message = response.choices[0].message
+        if response_message.get("tool_calls"):
+            # Round budget exhausted — force a final text answer
+            messages.append(response_message)
+            for tool_call in response_message["tool_calls"]:
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call["id"],
+                    "name": tool_call["function"]["name"],
+                    "content": "❌ Tool-call budget exhausted; answer with the information gathered so far.",
+                })
+            response_message, usage = _stream_completion(
+                client,
+                on_update=on_update,
+                model=model_name,
+                messages=messages,
+                tools=openai_tools,
+                tool_choice="none",
+            )
+            _add_usage(usage)
 
-        return tools_used, response_message.content, total_usage
+        return tools_used, response_message["content"], total_usage
     except Exception as e:
         import traceback
         return None, f"❌ Error: {str(e)}\n\n{traceback.format_exc()}", {}
 
 
-async def handle_ai_conversation_anthropic(user_message, endpoint, api_key):
+async def handle_ai_conversation_anthropic(user_message, endpoint, api_key, on_update=None):
     """Handle conversation with Anthropic Claude and execute tool calls via SSE"""
     if not api_key:
         return None, "Please provide an Anthropic API key in the sidebar."
@@ -171,7 +576,7 @@ async def handle_ai_conversation_anthropic(user_message, endpoint, api_key):
         return None, "❌ anthropic library not installed. Run: pip install anthropic"
 
     if not st.session_state.mcp_tools:
-        st.session_state.mcp_tools = await get_mcp_tools(endpoint)
+        set_mcp_tools(await get_mcp_tools(endpoint))
     if not st.session_state.mcp_tools:
         return None, "No MCP tools available. Check your MCP endpoint."
 
@@ -185,6 +590,7 @@ async def handle_ai_conversation_anthropic(user_message, endpoint, api_key):
     history.append({"role": "user", "content": user_message})
 
     try:
+        import anthropic as anthropic_sdk
         client = anthropic_sdk.Anthropic(api_key=api_key)
         tools_used = []
         total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
@@ -214,16 +620,20 @@ async def handle_ai_conversation_anthropic(user_message, endpoint, api_key):
             # Append assistant turn
             history.append({"role": "assistant", "content": response.content})
 
+            # Execute all tool_use blocks from this turn concurrently
+            tool_blocks = [b for b in response.content if b.type == "tool_use"]
+            results = await asyncio.gather(*[
+                call_mcp_tool(endpoint, block.name, block.input)
+                for block in tool_blocks
+            ])
             tool_results = []
-            for block in response.content:
-                if block.type == "tool_use":
-                    tools_used.append({"name": block.name, "args": block.input})
-                    tool_result = await call_mcp_tool(endpoint, block.name, block.input)
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": tool_result,
-                    })
+            for block, tool_result in zip(tool_blocks, results):
+                tools_used.append({"name": block.name, "args": block.input})
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": block.id,
+                    "content": tool_result,
+                })
             history.append({"role": "user", "content": tool_results})
 
         return tools_used, "❌ Max tool calls exceeded.", total_usage
@@ -232,7 +642,7 @@ async def handle_ai_conversation_anthropic(user_message, endpoint, api_key):
         return None, f"❌ Error: {str(e)}\n\n{traceback.format_exc()}", {}
 
 
-async def handle_ai_conversation_gemini(user_message, endpoint, api_key):
+async def handle_ai_conversation_gemini(user_message, endpoint, api_key, on_update=None):
     """Handle conversation with Google Gemini and execute tool calls via SSE"""
     if not api_key:
         return None, "Please provide a Gemini API key in the sidebar."
@@ -240,10 +650,12 @@ async def handle_ai_conversation_gemini(user_message, endpoint, api_key):
         return None, "❌ google-generativeai library not installed. Run: pip install google-generativeai"
 
     if not st.session_state.mcp_tools:
-        st.session_state.mcp_tools = await get_mcp_tools(endpoint)
+        set_mcp_tools(await get_mcp_tools(endpoint))
     if not st.session_state.mcp_tools:
         return None, "No MCP tools available. Check your MCP endpoint."
 
+    import google.generativeai as genai
+
     genai.configure(api_key=api_key)
     tool_declarations = to_gemini_declarations(st.session_state.mcp_tools)
 
@@ -305,15 +717,20 @@ async def handle_ai_conversation_gemini(user_message, endpoint, api_key):
 
 
 # CUSTOM CSS & GLOBAL UI COMPONENTS
-st.markdown(f"""
+# The ~3KB style sheet is static — build it once and let Streamlit cache the
+# string instead of re-formatting it on every rerun. Only the connection
+# status span in the top nav is dynamic, so it lives in its own placeholder.
+@st.cache_data
+def _page_css() -> str:
+    return """
 <style>
-    .stApp {{
+    .stApp {
         background-color: #ffffff;
         color: #333333;
-    }}
+    }
     
     /* Global Fixed Top Bar */
-    .top-nav {{
+    .top-nav {
         position: fixed;
         top: 0;
         left: 0;
@@ -326,34 +743,34 @@ st.markdown(f"""
         display: flex;
         justify-content: space-between;
         align-items: center;
-    }}
-    .top-nav h2 {{
+    }
+    .top-nav h2 {
         color: white !important;
         margin: 0 !important;
         font-size: 20px !important;
-    }}
+    }
 
     /* Layout adjustments for fixed header */
-    .block-container {{
+    .block-container {
         padding-top: 5rem !important;
         padding-bottom: 6rem !important;
-    }}
+    }
 
-    [data-testid="stChatMessage"] {{
+    [data-testid="stChatMessage"] {
         border-radius: 12px;
         margin-bottom: 8px;
         padding: 4px 12px !important;
         background-color: #f7f9f7 !important;
         border: 1px solid #e1e8e1;
-    }}
+    }
 
     /* Pulsing animation for loading */
-    @keyframes pulse {{
-        0% {{ opacity: 0.6; transform: scale(0.98); }}
-        50% {{ opacity: 1; transform: scale(1.01); }}
-        100% {{ opacity: 0.6; transform: scale(0.98); }}
-    }}
-    .thinking-box {{
+    @keyframes pulse {
+        0% { opacity: 0.6; transform: scale(0.98); }
+        50% { opacity: 1; transform: scale(1.01); }
+        100% { opacity: 0.6; transform: scale(0.98); }
+    }
+    .thinking-box {
         background: #ffffff;
         border: 1px solid #e1e8e1;
         border-radius: 10px;
@@ -364,28 +781,28 @@ st.markdown(f"""
         animation: pulse 2s infinite ease-in-out;
         width: fit-content;
         box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.05);
-    }}
-    .thinking-dot {{
+    }
+    .thinking-dot {
         width: 8px;
         height: 8px;
         background: #76BC21;
         border-radius: 50%;
-    }}
+    }
 
     /* Sidebar Styling */
-    section[data-testid="stSidebar"] {{
+    section[data-testid="stSidebar"] {
         background-color: #f8fafc;
         border-right: 1px solid #e2e8f0;
-    }}
+    }
 
     /* Hide Streamlit default components */
-    header {{visibility: hidden; height: 0px !important;}}
-    #MainMenu {{visibility: hidden;}}
-    footer {{visibility: hidden;}}
-    .stApp > header {{display: none !important;}}
+    header {visibility: hidden; height: 0px !important;}
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    .stApp > header {display: none !important;}
 
     /* Fixed Footer */
-    .fixed-footer {{
+    .fixed-footer {
         position: fixed;
         left: 0;
         bottom: 0;
@@ -397,22 +814,47 @@ st.markdown(f"""
         font-size: 11px;
         border-top: 1px solid #eeeeee;
         z-index: 999;
-    }}
-</style>
+    }
+</style>"""
 
+
+# Static page chrome built once at import — reruns only format in the
+# one dynamic bit (connection status).
+_TOP_NAV_TEMPLATE = """
 <div class="top-nav">
     <div>
         <h2 style="display: inline; margin-right: 10px;">🌐 IBM MQ Remote AI Assistant</h2>
     </div>
     <div style="font-weight: 600; font-size: 14px;">
-        {'<span style="color: #ccffcc;">🟢 Connected</span>' if st.session_state.connection_status == "connected" else '<span style="color: #ff9999;">🔴 Disconnected</span>'}
+        {status_html}
     </div>
 </div>
 
 <div class="fixed-footer">
     v1.0 Remote AI Client | SSE + OpenAI
 </div>
-""", unsafe_allow_html=True)
+"""
+
+_THINKING_HTML = """
+<div class="thinking-box">
+    <div class="thinking-dot" style="animation-delay: 0s"></div>
+    <div class="thinking-dot" style="animation-delay: 0.2s"></div>
+    <div class="thinking-dot" style="animation-delay: 0.4s"></div>
+    <span>AI Assistant is analyzing and calling tools...</span>
+</div>
+"""
+
+st.markdown(_page_css(), unsafe_allow_html=True)
+
+top_nav_placeholder = st.empty()
+status_html = (
+    '<span style="color: #ccffcc;">🟢 Connected</span>'
+    if st.session_state.connection_status == "connected"
+    else '<span style="color: #ff9999;">🔴 Disconnected</span>'
+)
+top_nav_placeholder.markdown(
+    _TOP_NAV_TEMPLATE.format(status_html=status_html), unsafe_allow_html=True
+)
 
 st.markdown("""
 <div style="background-color: #f1f8e9; border-left: 5px solid #76BC21; padding: 15px; border-radius: 8px; margin-bottom: 25px; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.05);">
@@ -434,14 +876,16 @@ with st.sidebar:
         st.session_state.mcp_endpoint = mcp_endpoint
         st.session_state.connection_status = "unknown"
         st.session_state.mcp_tools = []
+        st.session_state.openai_tools = []
+        st.session_state.pop("mcp_tools_cache", None)
     
     if st.button("🔄 Test Connection", type="secondary", use_container_width=True):
         with st.spinner("Testing connection..."):
-            success, message = asyncio.run(check_connection(st.session_state.mcp_endpoint))
+            success, message = run_async(check_connection(st.session_state.mcp_endpoint))
             if success:
                 st.session_state.connection_status = "connected"
                 st.success(f"✅ {message}")
-                st.session_state.mcp_tools = asyncio.run(get_mcp_tools(st.session_state.mcp_endpoint))
+                set_mcp_tools(run_async(get_mcp_tools(st.session_state.mcp_endpoint)))
                 st.info(f"Loaded {len(st.session_state.mcp_tools)} tools")
             else:
                 st.session_state.connection_status = "disconnected"
@@ -468,6 +912,16 @@ with st.sidebar:
             os.environ["OPENAI_API_KEY"] = api_key
         else:
             st.warning("Please enter your OpenAI API Key.")
+
+        # Faster tool-calling tiers match gpt-4's argument-format adherence
+        # at a fraction of the latency and cost
+        model_options = ["gpt-4o-mini", "gpt-4o", "gpt-4-turbo", "gpt-4"]
+        default_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        st.session_state.openai_model = st.selectbox(
+            "Model",
+            model_options,
+            index=model_options.index(default_model) if default_model in model_options else 0,
+        )
     elif provider_choice == "anthropic":
         api_key = st.text_input("🔑 Anthropic API Key", type="password", value=st.session_state.anthropic_api_key)
         if api_key:
@@ -488,8 +942,22 @@ with st.sidebar:
     st.code(f"Endpoint: {st.session_state.mcp_endpoint}", language="text")
     st.code(f"Tools: {len(st.session_state.mcp_tools)}", language="text")
 
-# Display chat messages
-for message in st.session_state.messages_remote:
+# Display chat messages — only the recent window by default. Streamlit
+# re-renders every widget on every rerun, so long sessions otherwise pay
+# for the full transcript (markdown + tool tables) on each keystroke.
+_HISTORY_PAGE_SIZE = 20
+
+if "history_display_count" not in st.session_state:
+    st.session_state.history_display_count = _HISTORY_PAGE_SIZE
+
+_transcript = st.session_state.messages_remote
+_hidden = len(_transcript) - st.session_state.history_display_count
+if _hidden > 0:
+    if st.button(f"⬆️ Show older messages ({_hidden} hidden)"):
+        st.session_state.history_display_count += _HISTORY_PAGE_SIZE
+        st.rerun()
+
+for message in _transcript[-st.session_state.history_display_count:]:
     with st.chat_message(message["role"]):
         st.markdown(message["content"])
         
@@ -499,26 +967,7 @@ for message in st.session_state.messages_remote:
 
         # Display tools used if available
         if "tools_used" in message and message["tools_used"] and should_show_logging():
-            with st.expander("🔧 Tools Used (in order)"):
-                for idx, tool in enumerate(message["tools_used"], 1):
-                    col1, col2 = st.columns([1, 4])
-                    with col1:
-                        st.markdown(f"**Step {idx}**")
-                    with col2:
-                        st.markdown(f"**`{tool['name']}`**")
-                    
-                    if tool.get('args'):
-                        st.json(tool['args'], expanded=False)
-                    
-                    # Show REST endpoint if logging is enabled
-                    if should_show_logging():
-                        rest_endpoint = get_rest_api_url(tool['name'], tool.get('args', {}))
-                        st.code(rest_endpoint, language="text")
-                
-                # Show token usage inside expander
-                if "usage" in message and message["usage"]:
-                    st.divider()
-                    st.caption(f"📊 **Token Usage:** {message['usage'].get('total_tokens', 0)} total ({message['usage'].get('prompt_tokens', 0)} prompt, {message['usage'].get('completion_tokens', 0)} completion)")
+            render_tools_used(message["tools_used"], message.get("usage"))
 
 # User input
 if prompt := st.chat_input("Ask something about IBM MQ..."):
@@ -545,14 +994,7 @@ if prompt := st.chat_input("Ask something about IBM MQ..."):
         with st.chat_message("assistant"):
             message_placeholder = st.empty()
             tools_placeholder = st.empty()
-            message_placeholder.markdown("""
-                <div class="thinking-box">
-                    <div class="thinking-dot" style="animation-delay: 0s"></div>
-                    <div class="thinking-dot" style="animation-delay: 0.2s"></div>
-                    <div class="thinking-dot" style="animation-delay: 0.4s"></div>
-                    <span>AI Assistant is analyzing and calling tools...</span>
-                </div>
-            """, unsafe_allow_html=True)
+            message_placeholder.markdown(_THINKING_HTML, unsafe_allow_html=True)
             
             try:
                 provider = st.session_state.selected_provider
@@ -562,11 +1004,12 @@ if prompt := st.chat_input("Ask something about IBM MQ..."):
                     "gemini": (handle_ai_conversation_gemini, st.session_state.gemini_api_key),
                 }
                 handler, active_key = handler_map[provider]
-                tools_used, full_response, usage = asyncio.run(
+                tools_used, full_response, usage = run_async(
                     handler(
-                        prompt, 
+                        prompt,
                         st.session_state.mcp_endpoint,
-                        active_key
+                        active_key,
+                        on_update=lambda text: message_placeholder.markdown(text)
                     )
                 )
             except Exception as e:
@@ -585,26 +1028,9 @@ if prompt := st.chat_input("Ask something about IBM MQ..."):
 
             # Display tools used
             if tools_used and should_show_logging():
-                with tools_placeholder.expander("🔧 Tools Used by AI"):
-                    for idx, tool in enumerate(tools_used, 1):
-                        col1, col2 = st.columns([1, 4])
-                        with col1:
-                            st.markdown(f"**Step {idx}**")
-                        with col2:
-                            st.markdown(f"**`{tool['name']}`**")
-                        
-                        if tool.get('args'):
-                            st.json(tool['args'], expanded=False)
-                        
-                        # Show REST endpoint if logging is enabled
-                        if should_show_logging():
-                            rest_endpoint = get_rest_api_url(tool['name'], tool.get('args', {}))
-                            st.code(rest_endpoint, language="text")
-                    
-                    # Show token usage inside expander
-                    if usage:
-                        st.divider()
-                        st.caption(f"📊 **Token Usage:** {usage.get('total_tokens', 0)} total ({usage.get('prompt_tokens', 0)} prompt, {usage.get('completion_tokens', 0)} completion)")
+                render_tools_used(tools_used, usage,
+                                  title="🔧 Tools Used by AI",
+                                  container=tools_placeholder)
         
         # Add assistant response to chat history with tools used
         st.session_state.messages_remote.append({
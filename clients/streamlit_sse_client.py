@@ -1,5 +1,13 @@
 import streamlit as st
 import asyncio
+import atexit
+import re
+import string
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from functools import lru_cache
+
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 from dotenv import load_dotenv
@@ -17,70 +25,112 @@ if "server_url" not in st.session_state:
 if "connection_status" not in st.session_state:
     st.session_state.connection_status = "unknown"
 
+@dataclass(frozen=True, slots=True)
+class Operation:
+    """One entry of the static operation table — immutable, attribute access."""
+    tool: str = ""
+    args: dict = None
+    description: str = ""
+    fixed_args: dict = None
+    mqsc_template: str = ""
+    smart_workflow: str = ""
+    header: bool = False
+
+
 # Define available tools/operations
 OPERATIONS = {
-    "Select an operation...": {},
-    "--- Infrastructure ---": {"header": True},
-    "List Queue Managers": {
-        "tool": "dspmq",
-        "args": {"qmgr_name": "Optional Queue Manager Name"},
-        "description": "List all IBM MQ queue managers and their status."
-    },
-    "Check MQ Version": {
-        "tool": "dspmqver",
-        "args": {"qmgr_name": "Optional Queue Manager Name"},
-        "description": "Display IBM MQ version and installation details."
-    },
-    "Show Queue Manager Properties": {
-        "tool": "runmqsc",
-        "args": {"qmgr_name": "Queue Manager Name"},
-        "fixed_args": {"mqsc_command": "DISPLAY QMGR"},
-        "description": "View full configuration and properties of a specific QMGR."
-    },
-    "--- Queues ---": {"header": True},
-    "List all Queues": {
-        "tool": "runmqsc",
-        "args": {"qmgr_name": "Queue Manager Name"},
-        "fixed_args": {"mqsc_command": "DISPLAY QLOCAL(*)"},
-        "description": "Get a list of all local queues defined on the queue manager."
-    },
-    "Check Queue Depth": {
-        "smart_workflow": "check_depth",
-        "tool": "runmqsc",  # Placeholder, logic handled in smart_workflow
-        "args": {"queue_name": "Queue Name"},
-        "description": "Auto-locate queue and check current number of messages (CURDEPTH)."
-    },
-    "Check Queue Status": {
-        "smart_workflow": "check_status",
-        "tool": "runmqsc",
-        "args": {"queue_name": "Queue Name"},
-        "description": "Auto-locate queue and check open input/output counts (QSTATUS)."
-    },
-    "--- Channels & Listeners ---": {"header": True},
-    "Show Channels": {
-        "tool": "runmqsc",
-        "args": {"qmgr_name": "Queue Manager Name"},
-        "fixed_args": {"mqsc_command": "DISPLAY CHANNEL(*)"},
-        "description": "Display all channel definitions on the queue manager."
-    },
-    "Check Channel Status": {
-        "tool": "runmqsc",
-        "args": {"qmgr_name": "Queue Manager Name", "channel_name": "Channel Name"},
-        "mqsc_template": "DISPLAY CHSTATUS({channel_name})",
-        "description": "Check if a specific channel is RUNNING, BINDING, or INACTIVE."
-    },
-    "--- Custom ---": {"header": True},
-    "Run Custom MQSC Command": {
-        "tool": "runmqsc",
-        "args": {"qmgr_name": "Queue Manager Name", "mqsc_command": "MQSC Command"},
-        "description": "Execute a raw MQSC command against a queue manager."
-    },
-    "--- Discovery ---": {"header": True},
-    "Find a Queue/Channel": {
-        "tool": "find_mq_object",
-        "args": {"search_string": "Search Query (e.g. queue name)"},
-        "description": "Search across all Queue Managers to find where a Queue or Channel exists."
-    }
+    "Select an operation...": Operation(),
+    "--- Infrastructure ---": Operation(header=True),
+    "List Queue Managers": Operation(
+        tool="dspmq",
+        args={"qmgr_name": "Optional Queue Manager Name"},
+        description="List all IBM MQ queue managers and their status."
+    ),
+    "Check MQ Version": Operation(
+        tool="dspmqver",
+        args={"qmgr_name": "Optional Queue Manager Name"},
+        description="Display IBM MQ version and installation details."
+    ),
+    "Show Queue Manager Properties": Operation(
+        tool="runmqsc",
+        args={"qmgr_name": "Queue Manager Name"},
+        fixed_args={"mqsc_command": "DISPLAY QMGR"},
+        description="View full configuration and properties of a specific QMGR."
+    ),
+    "--- Queues ---": Operation(header=True),
+    "List all Queues": Operation(
+        tool="runmqsc",
+        args={"qmgr_name": "Queue Manager Name"},
+        fixed_args={"mqsc_command": "DISPLAY QLOCAL(*)"},
+        description="Get a list of all local queues defined on the queue manager."
+    ),
+    "Check Queue Depth": Operation(
+        smart_workflow="check_depth",
+        tool="runmqsc",  # Placeholder, logic handled in smart_workflow
+        args={"queue_name": "Queue Name"},
+        description="Auto-locate queue and check current number of messages (CURDEPTH)."
+    ),
+    "Check Queue Status": Operation(
+        smart_workflow="check_status",
+        tool="runmqsc",
+        args={"queue_name": "Queue Name"},
+        description="Auto-locate queue and check open input/output counts (QSTATUS)."
+    ),
+    "--- Channels & Listeners ---": Operation(header=True),
+    "Show Channels": Operation(
+        tool="runmqsc",
+        args={"qmgr_name": "Queue Manager Name"},
+        fixed_args={"mqsc_command": "DISPLAY CHANNEL(*)"},
+        description="Display all channel definitions on the queue manager."
+    ),
+    "Check Channel Status": Operation(
+        tool="runmqsc",
+        args={"qmgr_name": "Queue Manager Name", "channel_name": "Channel Name"},
+        mqsc_template="DISPLAY CHSTATUS({channel_name})",
+        description="Check if a specific channel is RUNNING, BINDING, or INACTIVE."
+    ),
+    "--- Custom ---": Operation(header=True),
+    "Run Custom MQSC Command": Operation(
+        tool="runmqsc",
+        args={"qmgr_name": "Queue Manager Name", "mqsc_command": "MQSC Command"},
+        description="Execute a raw MQSC command against a queue manager."
+    ),
+    "--- Discovery ---": Operation(header=True),
+    "Find a Queue/Channel": Operation(
+        tool="find_mq_object",
+        args={"search_string": "Search Query (e.g. queue name)"},
+        description="Search across all Queue Managers to find where a Queue or Channel exists."
+    )
+}
+
+# Derived once at import — reruns shouldn't re-filter a static table
+VALID_OPS = tuple(k for k, v in OPERATIONS.items() if not v.header)
+
+# MQSC templates compiled once — .format() re-parses the format string on
+# every Execute, string.Template parses here at import and only substitutes
+_MQSC_TEMPLATES = {
+    op.mqsc_template: string.Template(op.mqsc_template.replace("{", "${"))
+    for op in OPERATIONS.values() if op.mqsc_template
+}
+
+
+def _make_arg_builder(op):
+    """Partially evaluate the per-op payload shape into one closure."""
+    if op.mqsc_template:
+        tpl = _MQSC_TEMPLATES[op.mqsc_template]
+        return lambda ta, _tpl=tpl: {
+            "qmgr_name": ta.get("qmgr_name", ""),
+            "mqsc_command": _tpl.substitute(ta),
+        }
+    if op.fixed_args:
+        return lambda ta, _fa=op.fixed_args: {**ta, **_fa}
+    return dict
+
+
+# Execute-click payload builders, resolved once per operation at import so
+# the hot path is a single call with no shape branching
+_ARG_BUILDERS = {
+    name: _make_arg_builder(op) for name, op in OPERATIONS.items() if not op.header
 }
 
 
@@ -88,95 +138,478 @@ OPERATIONS = {
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _mcp_http_client_factory(headers=None, timeout=None, auth=None):
+    """
+    Build the httpx client the MCP SSE transport runs over.
+
+    The SDK default opens a connection per POST; a keep-alive pool amortizes
+    the TCP handshake across the session's tool calls, which matters most for
+    the multi-QMGR fan-outs.
+    """
+    import httpx
+    if timeout is None:
+        timeout = httpx.Timeout(30.0, read=300.0)
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout,
+        auth=auth,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+
+
+def _sse_client_kwargs():
+    """Inject the pooled-client factory only when the installed SDK supports it."""
+    import inspect
+    if "httpx_client_factory" in inspect.signature(sse_client).parameters:
+        return {"httpx_client_factory": _mcp_http_client_factory}
+    return {}
+
+
+def get_event_loop():
+    """
+    Get or create a long-lived event loop for this Streamlit session.
+
+    asyncio.run() builds and tears down a fresh loop per call — killing the
+    cached MCP session bound to it. One persistent loop keeps the connection
+    alive across reruns and skips the per-click loop setup cost.
+
+    Deliberately driven from the script thread via run_until_complete rather
+    than a background run_forever daemon: same pooling win, but abandoned
+    calls stay cancellable on rerun (see cancel_abandoned_task) and nothing
+    touches Streamlit state from a foreign thread.
+    """
+    loop = st.session_state.get("event_loop")
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        st.session_state.event_loop = loop
+    return loop
+
+
+# Bound every MCP round-trip so a hung server can't wedge the script thread
+_CALL_TIMEOUT = 30.0
+
+
+def run_async(coro):
+    """
+    Run a coroutine on the session's persistent event loop.
+
+    The coroutine is wrapped in a Task kept in session state so a rerun that
+    interrupts the script can cancel the abandoned call instead of leaving it
+    holding an SSE slot.
+    """
+    loop = get_event_loop()
+    task = asyncio.ensure_future(coro, loop=loop)
+    st.session_state["_active_task"] = task
+    try:
+        return loop.run_until_complete(task)
+    finally:
+        st.session_state["_active_task"] = None
+
+
+def cancel_abandoned_task():
+    """Cancel a task a previous, interrupted script run left in flight."""
+    task = st.session_state.get("_active_task")
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        get_event_loop().run_until_complete(task)
+    except asyncio.CancelledError:
+        pass
+    except Exception:
+        pass
+    st.session_state["_active_task"] = None
+
+
+class MCPConnection:
+    """
+    One long-lived sse_client + ClientSession per server URL.
+
+    Every Execute click used to pay a full SSE connect + initialize handshake
+    per tool call — N times in a row for the multi-QMGR workflows. Keeping the
+    session open drops each call to a single call_tool round-trip.
+    """
+
+    def __init__(self, server_url):
+        self.server_url = server_url
+        self.session = None
+        self._stack = None
+        self._loop = None
+
+    async def get_session(self):
+        """Return the live session, (re)connecting lazily on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The session is bound to the loop that created it — a new loop
+            # means the old session is unusable
+            await self.aclose()
+            self._loop = loop
+        if self.session is None:
+            self._stack = AsyncExitStack()
+            streams = await self._stack.enter_async_context(
+                sse_client(self.server_url, **_sse_client_kwargs())
+            )
+            session = await self._stack.enter_async_context(ClientSession(streams[0], streams[1]))
+            await session.initialize()
+            self.session = session
+        return self.session
+
+    async def aclose(self):
+        """Tear down the streams and session, ignoring shutdown races."""
+        stack, self._stack, self.session = self._stack, None, None
+        if stack is not None:
+            try:
+                await stack.aclose()
+            except Exception:
+                pass
+
+
+def get_mcp_connection(server_url) -> MCPConnection:
+    """Fetch (or create) the cached connection for this endpoint."""
+    connections = st.session_state.setdefault("mcp_connections", {})
+    if server_url not in connections:
+        connections[server_url] = MCPConnection(server_url)
+    return connections[server_url]
+
+
+def cleanup_on_exit():
+    """Close cached MCP connections and the session loop on exit — best effort."""
+    try:
+        loop = st.session_state.get("event_loop")
+        for connection in st.session_state.get("mcp_connections", {}).values():
+            try:
+                if loop is not None and not loop.is_closed():
+                    loop.run_until_complete(connection.aclose())
+                else:
+                    asyncio.run(connection.aclose())
+            except Exception:
+                pass
+        if loop is not None and not loop.is_closed():
+            loop.close()
+    except Exception:
+        pass
+
+
+atexit.register(cleanup_on_exit)
+
+
+@dataclass(slots=True)
+class ToolResult:
+    """Tagged tool outcome — callers branch on `ok` instead of substring-
+    scanning potentially huge MQSC output for the ❌ marker."""
+    ok: bool
+    text: str
+
+
 async def call_mcp_tool(server_url, tool_name, arguments):
-    """Connect to SSE and call a specific tool"""
+    """
+    Call a specific tool over the shared SSE session; returns a ToolResult.
+
+    Single-flight: identical calls issued while one is still in flight (the
+    double-click submit, a workflow asking the same QMGR twice) await the
+    first call's task instead of dispatching their own.
+    """
+    inflight = st.session_state.setdefault("_inflight_calls", {})
+    key = (server_url, tool_name, tuple(sorted(arguments.items())))
+    task = inflight.get(key)
+    if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+        return await asyncio.shield(task)
+    task = asyncio.ensure_future(_call_mcp_tool(server_url, tool_name, arguments))
+    inflight[key] = task
+    try:
+        return await task
+    finally:
+        if inflight.get(key) is task:
+            inflight.pop(key, None)
+
+
+async def _call_mcp_tool(server_url, tool_name, arguments):
+    """The actual tool call — admission, session, reconnect, error mapping."""
+    connection = get_mcp_connection(server_url)
+    admission = get_admission_controller()
     try:
-        async with sse_client(server_url) as streams:
-            async with ClientSession(streams[0], streams[1]) as session:
-                await session.initialize()
-                result = await session.call_tool(tool_name, arguments)
-                if result.content:
-                    return result.content[0].text
-                return "✅ Command executed (No output)"
+        await admission.acquire()
+        try:
+            for attempt in (0, 1):
+                try:
+                    session = await connection.get_session()
+                    result = await asyncio.wait_for(
+                        session.call_tool(tool_name, arguments), timeout=_CALL_TIMEOUT
+                    )
+                    break
+                except (asyncio.CancelledError, asyncio.TimeoutError):
+                    raise
+                except Exception:
+                    # Idle SSE sessions get dropped by proxies; the first call
+                    # after a quiet spell then fails on a dead stream. Rebuild
+                    # the connection and retry once before reporting failure.
+                    await connection.aclose()
+                    if attempt:
+                        raise
+        finally:
+            # Shielded so a cancelled call still gives its slot back
+            await asyncio.shield(admission.release())
+        if result.content:
+            return ToolResult(ok=True, text=result.content[0].text)
+        return ToolResult(ok=True, text="✅ Command executed (No output)")
+    except asyncio.CancelledError:
+        # Rerun abandoned this call — release the connection and propagate
+        await connection.aclose()
+        raise
+    except asyncio.TimeoutError:
+        await connection.aclose()
+        return ToolResult(ok=False, text=f"❌ Error: tool call timed out after {_CALL_TIMEOUT:.0f}s")
     except Exception as e:
+        # Drop the connection so the next call reconnects cleanly
+        await connection.aclose()
         # Handle ExceptionGroups (TaskGroup errors)
         if hasattr(e, 'exceptions'):
             error_msgs = [str(ex) for ex in e.exceptions]
-            return f"❌ Error: {'; '.join(error_msgs)}"
-        return f"❌ Error: {str(e)}"
+            return ToolResult(ok=False, text=f"❌ Error: {'; '.join(error_msgs)}")
+        return ToolResult(ok=False, text=f"❌ Error: {str(e)}")
+
+
+async def stream_mcp_tool(server_url, tool_name, arguments, on_progress=None):
+    """
+    Yield tool output incrementally when the SDK supports it.
+
+    The current MCP SDK only returns complete CallToolResults, so this yields
+    the body once today; if a streaming call_tool variant appears, large
+    runmqsc dumps (e.g. DISPLAY QLOCAL(*)) will paint chunk by chunk. Until
+    then, server progress notifications are forwarded through on_progress so
+    long calls show life before the last byte arrives.
+    """
+    connection = get_mcp_connection(server_url)
+    try:
+        session = await connection.get_session()
+        call_stream = getattr(session, "call_tool_stream", None)
+        if call_stream is not None:
+            async for chunk in call_stream(tool_name, arguments):
+                text = getattr(chunk, "text", None)
+                if text:
+                    yield text
+            return
+
+        progress_callback = None
+        if on_progress is not None:
+            async def progress_callback(progress, total, message):
+                on_progress(progress, total, message)
+
+        result = await asyncio.wait_for(
+            session.call_tool(tool_name, arguments, progress_callback=progress_callback),
+            timeout=_CALL_TIMEOUT,
+        )
+        if result.content:
+            yield result.content[0].text
+        else:
+            yield "✅ Command executed (No output)"
+    except asyncio.CancelledError:
+        await connection.aclose()
+        raise
+    except asyncio.TimeoutError:
+        await connection.aclose()
+        yield f"❌ Error: tool call timed out after {_CALL_TIMEOUT:.0f}s"
+    except Exception as e:
+        await connection.aclose()
+        if hasattr(e, 'exceptions'):
+            yield f"❌ Error: {'; '.join(str(ex) for ex in e.exceptions)}"
+        else:
+            yield f"❌ Error: {str(e)}"
+
+
+async def drain_to_placeholder(server_url, tool_name, arguments, placeholder):
+    """Stream chunks into a code placeholder as they arrive; returns the full text."""
+    buffer = ""
+
+    def show_progress(progress, total, message):
+        detail = message or (f"{progress:g}/{total:g}" if total else f"{progress:g}")
+        placeholder.code(f"⏳ {tool_name}: {detail}", language="text")
+
+    async for chunk in stream_mcp_tool(server_url, tool_name, arguments, on_progress=show_progress):
+        buffer += chunk
+        if "❌" not in buffer:
+            placeholder.code(buffer, language="text")
+    return buffer
+
+
+# Default cap on in-flight MCP calls during multi-QMGR fan-out
+_MAX_CONCURRENT_CALLS = 8
+
+
+class AdmissionController:
+    """
+    Bound the number of MCP calls in flight.
+
+    A Condition-protected counter rather than a Semaphore so the cap can be
+    retuned at runtime from the UI — an installation with dozens of QMGRs
+    would otherwise fire one SSE request and server-side MQSC subprocess per
+    queue manager at once.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+
+def get_admission_controller() -> AdmissionController:
+    """Per-session controller, rebuilt if the event loop changed (Condition is loop-bound)."""
+    loop = asyncio.get_event_loop()
+    limit = st.session_state.get("max_concurrent_calls", _MAX_CONCURRENT_CALLS)
+    entry = st.session_state.get("_admission")
+    if entry is None or entry[0] is not loop:
+        entry = (loop, AdmissionController(limit))
+        st.session_state["_admission"] = entry
+    entry[1].limit = limit
+    return entry[1]
+
+
+async def gather_runmqsc(server_url, qmgrs, command_template, queue_name):
+    """
+    Run one runmqsc per queue manager concurrently over the shared session.
+
+    The smart workflows used to serialise N independent round-trips; fanning
+    out with asyncio.gather makes wall-clock time max(latency) instead of
+    sum(latency). call_mcp_tool's admission controller caps how many are
+    actually in flight.
+    """
+
+    async def one_call(qmgr):
+        args = {"qmgr_name": qmgr, "mqsc_command": command_template.format(queue=queue_name)}
+        return args, await call_mcp_tool(server_url, "runmqsc", args)
+
+    return await asyncio.gather(*(one_call(q) for q in qmgrs), return_exceptions=True)
+
+
+# How long the connectivity probe's dspmq output stays fresh
+_DSPMQ_TTL = 30.0
 
 
 async def check_connection(server_url):
     """Check if we can connect to the SSE endpoint"""
+    connection = get_mcp_connection(server_url)
+    already_live = connection.session is not None
     try:
-        async with sse_client(server_url) as streams:
-            async with ClientSession(streams[0], streams[1]) as session:
-                await session.initialize()
-                return True
+        session = await connection.get_session()
+        if already_live:
+            # A protocol-level ping on the open session is all the rerun
+            # needs — no tool process spawns on the server side
+            await asyncio.wait_for(session.send_ping(), timeout=_CALL_TIMEOUT)
+            return True
+        # First connect: warm the path with a cheap dspmq while the session
+        # is hot — a "List Queue Managers" right after answers from cache
+        try:
+            result = await asyncio.wait_for(session.call_tool("dspmq", {}), timeout=_CALL_TIMEOUT)
+            if result.content:
+                st.session_state["_dspmq_cache"] = (time.monotonic(), result.content[0].text)
+        except Exception:
+            pass
+        return True
     except Exception as e:
+        await connection.aclose()
         print(f"Connection check failed: {e}")
         return False
 
 
+def get_cached_dspmq(args):
+    """Return the probe's dspmq output if it applies and is still fresh."""
+    if args.get("qmgr_name"):
+        return None
+    entry = st.session_state.get("_dspmq_cache")
+    if entry and (time.monotonic() - entry[0]) < _DSPMQ_TTL:
+        return entry[1]
+    return None
+
+
+# Prefer Google RE2 when installed — a linear-time C scanner that keeps up
+# with megabyte-scale search dumps; the API (compile/finditer) is drop-in
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Compiled once per process; single-case — callers uppercase the buffer once
+# so the automaton never case-folds, and the class already excludes whitespace
+_QMGR_RE = _regex.compile(r'QM:\s*([A-Z0-9_.]+)')
+
+
 def extract_qmgrs_from_search(search_output: str) -> list:
     """Parse find_mq_object output to find queue manager names"""
-    import re
-    qmgrs = set()
-    for line in search_output.split('\n'):
-        match = re.search(r'QM:\s*([A-Z0-9_\.]+)', line, re.IGNORECASE)
-        if match:
-            qmgrs.add(match.group(1).strip())
-    return list(qmgrs)
+    # One C-level upper() pass; QMGR names are upper-case in the dump anyway
+    return list({m.group(1) for m in _QMGR_RE.finditer(search_output.upper())})
 
 
-def render_tool_call(tool_name: str, args: dict, result: str, expanded: bool = True, label: str = ""):
+def render_tool_call(tool_name: str, args: dict, result, expanded: bool = True, label: str = ""):
     """Render a standardised 'Tool Called' block.
-    
-    In manual SSE mode, we show the call details in an expander, 
+
+    In manual SSE mode, we show the call details in an expander,
     but the final output is also displayed for clarity.
+    Accepts a ToolResult (O(1) ok check) or a plain string from the
+    streaming path (falls back to the marker scan).
     """
+    if isinstance(result, ToolResult):
+        ok, text = result.ok, result.text
+    else:
+        ok, text = "❌" not in result, result
     display = label or tool_name
     with st.expander(f"🔧 Tool Called: `{display}`", expanded=expanded):
         st.markdown(f"**Tool:** `{tool_name}`")
         st.json(args)
         if should_show_logging():
             st.code(get_rest_api_url(tool_name, args), language="text")
-        
+
         # We always show the output inside the expander as a fallback
-        if "❌" in result:
-            st.error(result)
+        if not ok:
+            st.error(text)
         else:
-            st.code(result, language="text")
+            st.code(text, language="text")
+
+
+# Prefix-dispatch table — one slice + dict get instead of chained startswith
+_QTYPE_DISPATCH = {
+    "QR": ("Remote Queue", "🌐", "DISPLAY QREMOTE({queue})"),
+    "QA": ("Alias Queue", "🔀", "DISPLAY QALIAS({queue})"),   # reveals TARGET
+    "QL": ("Local Queue", "📦", "DISPLAY QLOCAL({queue}) CURDEPTH"),
+}
+_QTYPE_DEFAULT = ("Queue", "📦", "DISPLAY QLOCAL({queue}) CURDEPTH")
 
 
+@lru_cache(maxsize=1024)
 def detect_queue_type(queue_name: str) -> tuple[str, str, str]:
     """
     Return (queue_type_label, icon, mqsc_command_template) for the given queue name.
     Queue name should already be normalised (stripped + uppercased).
+    Result tuples are immutable, so repeat checks across reruns hit the cache.
     """
-    if queue_name.startswith("QR"):
-        return (
-            "Remote Queue", "🌐",
-            "DISPLAY QREMOTE({queue})"
-        )
-    elif queue_name.startswith("QA"):
-        return (
-            "Alias Queue", "🔀",
-            "DISPLAY QALIAS({queue})"   # reveals TARGET
-        )
-    else:
-        label = "Local Queue" if queue_name.startswith("QL") else "Queue"
-        return (
-            label, "📦",
-            "DISPLAY QLOCAL({queue}) CURDEPTH"
-        )
+    return _QTYPE_DISPATCH.get(queue_name[:2], _QTYPE_DEFAULT)
+
+
+# A rerun can interrupt the script while an MCP call is still pending —
+# reap it before doing anything else this pass
+cancel_abandoned_task()
 
 
 # ---------------------------------------------------------------------------
 # CUSTOM CSS
 # ---------------------------------------------------------------------------
 
-st.markdown("""
+# Static markup built once at import. Streamlit replaces the element tree on
+# every rerun, so the blocks must still be emitted each pass — but emitting a
+# precompiled constant avoids rebuilding the strings, and only the footer's
+# server_url is formatted per rerun.
+_PAGE_CSS = """
 <style>
     .stApp { background-color: #ffffff; color: #333333; }
     .top-nav {
@@ -205,16 +638,25 @@ st.markdown("""
         border-top: 1px solid #eeeeee; z-index: 999;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# Top Nav
-st.markdown(f"""
+_TOP_NAV_TEMPLATE = """
 <div class="top-nav">
     <div><h2 style="display: inline; margin-right: 10px;">⚡ IBM MQ MCP Client (Direct)</h2></div>
     <div style="font-weight: 600; font-size: 14px; color: white;"></div>
 </div>
-<div class="fixed-footer">v2.1 Direct SSE Client | No LLM | Server: {st.session_state.server_url}</div>
-""", unsafe_allow_html=True)
+<div class="fixed-footer">v2.1 Direct SSE Client | No LLM | Server: {server_url}</div>
+"""
+
+@st.cache_data(show_spinner=False)
+def _page_chrome(server_url):
+    """CSS + top nav + footer as one payload, cached per endpoint."""
+    return _PAGE_CSS + _TOP_NAV_TEMPLATE.format(server_url=server_url)
+
+
+# One markdown element instead of two halves the chrome nodes the frontend
+# diffs per rerun; the call itself must still run each pass or it's dropped.
+st.markdown(_page_chrome(st.session_state.server_url), unsafe_allow_html=True)
 
 
 # ---------------------------------------------------------------------------
@@ -232,13 +674,18 @@ with st.expander("🔌 Connection Settings", expanded=True):
         st.markdown("<br>", unsafe_allow_html=True)
         if st.button("Check Connectivity"):
             with st.spinner("Connecting..."):
-                is_connected = asyncio.run(check_connection(st.session_state.server_url))
+                is_connected = run_async(check_connection(st.session_state.server_url))
                 if is_connected:
                     st.session_state.connection_status = "connected"
                     st.success("Connected!")
                 else:
                     st.session_state.connection_status = "error"
                     st.error("Connection Failed")
+    st.slider(
+        "Max concurrent MCP calls", min_value=1, max_value=16,
+        value=_MAX_CONCURRENT_CALLS, key="max_concurrent_calls",
+        help="Caps parallel runmqsc fan-out so large installations aren't stampeded.",
+    )
 
 # Main Operation Selection
 st.markdown("""
@@ -248,49 +695,49 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-valid_ops = [k for k, v in OPERATIONS.items() if not v.get("header")]
-choice = st.selectbox("Select Tool / Operation", valid_ops)
-
-if choice and choice != "Select an operation...":
-    op_config = OPERATIONS[choice]
-    st.info(f"💡 {op_config['description']}")
+choice = st.selectbox("Select Tool / Operation", VALID_OPS)
 
-    # Dynamic Inputs
-    tool_args = {}
-    if op_config.get("args"):
-        cols = st.columns(len(op_config["args"]))
-        for i, (arg_key, label) in enumerate(op_config["args"].items()):
-            with cols[i]:
-                tool_args[arg_key] = st.text_input(label, key=f"{choice}_{arg_key}")
 
-    st.markdown("<br>", unsafe_allow_html=True)
+@st.fragment
+def op_panel(choice):
+    """Execute-and-render panel for the selected operation.
 
-    if st.button("🚀 Execute Command", type="primary"):
+    Fragment-scoped: submitting the form reruns only this function, not the
+    whole script — the CSS/nav markdown and sidebar above are left untouched.
+    """
+    op_config = OPERATIONS[choice]
+    st.info(f"💡 {op_config.description}")
+
+    # Dynamic Inputs — inside a form so typing a queue name doesn't rerun the
+    # script per keystroke; one rerun fires on submit. Widgets are keyed by
+    # position so Streamlit hashes a short stable key instead of the label.
+    with st.form(f"exec_form_{choice}"):
+        tool_args = {}
+        op_args = op_config.args or {}
+        if op_args:
+            cols = st.columns(len(op_args))
+            for i, (arg_key, label) in enumerate(op_args.items()):
+                tool_args[arg_key] = cols[i].text_input(label, key=f"in_{i}_{choice}")
+
+        submitted = st.form_submit_button("🚀 Execute Command", type="primary")
+
+    if submitted:
         # Validate required params
         missing_params = [k for k, v in tool_args.items() if not v]
         if missing_params:
             st.error(f"⚠️ Missing required parameters: {', '.join(missing_params)}")
         else:
-            # Prepare final arguments
-            final_args = tool_args.copy()
-
-            # Merge fixed args
-            if "fixed_args" in op_config:
-                final_args.update(op_config["fixed_args"])
-
-            # Apply mqsc_template (constructs mqsc_command from user inputs)
-            if "mqsc_template" in op_config:
-                try:
-                    cmd = op_config["mqsc_template"].format(**tool_args)
-                    final_args["mqsc_command"] = cmd
-                    final_args = {k: v for k, v in final_args.items() if k in ("qmgr_name", "mqsc_command")}
-                except KeyError as e:
-                    st.error(f"Template error: Missing {e}")
-                    st.stop()
+            # Payload shape was resolved per operation at import — one call,
+            # no fixed_args/template branching on the click path
+            try:
+                final_args = _ARG_BUILDERS[choice](tool_args)
+            except KeyError as e:
+                st.error(f"Template error: Missing {e}")
+                st.stop()
 
             # --- Smart Workflow Execution ---
-            if "smart_workflow" in op_config:
-                workflow_type = op_config["smart_workflow"]
+            if op_config.smart_workflow:
+                workflow_type = op_config.smart_workflow
 
                 if workflow_type in ["check_depth", "check_status"]:
                     # Normalise: strip whitespace and uppercase to make prefix detection reliable
@@ -314,47 +761,69 @@ if choice and choice != "Select an operation...":
                     with st.spinner(f"🔍 Searching for {queue_name}..."):
                         # Step 1: Search
                         search_args = {"search_string": queue_name}
-                        search_res = asyncio.run(call_mcp_tool(st.session_state.server_url, "find_mq_object", search_args))
+                        search_res = run_async(call_mcp_tool(st.session_state.server_url, "find_mq_object", search_args))
                         if should_show_logging():
                             render_tool_call("find_mq_object", search_args, search_res)
 
                         # Step 2: Parse QMGRs
-                        qmgrs = extract_qmgrs_from_search(search_res)
+                        qmgrs = extract_qmgrs_from_search(search_res.text) if search_res.ok else []
 
                         if not qmgrs:
                             st.warning(f"Could not find queue '{queue_name}' on any known queue manager.")
                         else:
                             st.success(f"Found on {len(qmgrs)} Queue Manager(s): {', '.join(qmgrs)}")
 
-                            # Step 3: Run MQSC on each QMGR
-                            for qmgr in qmgrs:
-                                cmd = command_template.format(queue=queue_name)
-                                runmqsc_args = {"qmgr_name": qmgr, "mqsc_command": cmd}
-                                with st.spinner(f"Running runmqsc on {qmgr}..."):
-                                    res = asyncio.run(call_mcp_tool(st.session_state.server_url, "runmqsc", runmqsc_args))
+                            # Step 3: Run MQSC on all QMGRs concurrently
+                            with st.spinner(f"Running runmqsc on {len(qmgrs)} queue manager(s)..."):
+                                results = run_async(gather_runmqsc(
+                                    st.session_state.server_url, qmgrs,
+                                    command_template, queue_name
+                                ))
+                            for qmgr, outcome in zip(qmgrs, results):
+                                if isinstance(outcome, Exception):
+                                    cmd = command_template.format(queue=queue_name)
+                                    runmqsc_args = {"qmgr_name": qmgr, "mqsc_command": cmd}
+                                    res = ToolResult(ok=False, text=f"❌ Error: {outcome}")
+                                else:
+                                    runmqsc_args, res = outcome
                                 if should_show_logging():
                                     render_tool_call("runmqsc", runmqsc_args, res, label=f"runmqsc on {qmgr}", expanded=False)
-                                
+
                                 # Always show results prominently outside the tool log expander
                                 st.markdown(f"#### 📦 Results from `{qmgr}`")
-                                if "❌" in res:
-                                    st.error(res)
+                                if not res.ok:
+                                    st.error(res.text)
                                 else:
-                                    st.code(res, language="text")
+                                    st.code(res.text, language="text")
 
                 st.stop()  # End execution after smart workflow
 
-            # Standard tool execution
-            with st.spinner(f"Running {op_config['tool']}..."):
-                result = asyncio.run(call_mcp_tool(st.session_state.server_url, op_config["tool"], final_args))
-
-            if should_show_logging():
-                render_tool_call(op_config["tool"], final_args, result, expanded=False)
-            
-            # Display final result prominently
+            # Standard tool execution — stream output into the result block
             st.markdown("### 🏁 Final Result")
+            output_placeholder = st.empty()
+            cached = get_cached_dspmq(final_args) if op_config.tool == "dspmq" else None
+            if cached is not None:
+                result = cached
+            else:
+                with st.spinner(f"Running {op_config.tool}..."):
+                    result = run_async(drain_to_placeholder(
+                        st.session_state.server_url, op_config.tool, final_args,
+                        output_placeholder
+                    ))
+                # A fresh full listing is as good as the connect probe's —
+                # refill the TTL cache so repeat clicks answer locally
+                if op_config.tool == "dspmq" and not final_args.get("qmgr_name") and "❌" not in result:
+                    st.session_state["_dspmq_cache"] = (time.monotonic(), result)
+
             if "❌" in result or "🚫" in result:
-                st.error(result)
+                output_placeholder.error(result)
             else:
-                st.code(result, language="text")
+                output_placeholder.code(result, language="text")
                 st.success("Command Executed Successfully")
+
+            if should_show_logging():
+                render_tool_call(op_config.tool, final_args, result, expanded=False)
+
+
+if choice and choice != "Select an operation...":
+    op_panel(choice)
@@ -5,7 +5,10 @@ Provides reusable functions to display MCP tool calls with REST API endpoints.
 Configurable via MQ_SHOW_TOOL_LOGGING environment variable.
 """
 
+import functools
+import json
 import os
+from urllib.parse import urlsplit
 
 try:
     import streamlit as st
@@ -14,9 +17,30 @@ except ImportError:
     STREAMLIT_AVAILABLE = False
 
 
+# Environment is read once at import — these are queried on every rerun and
+# per rendered tool row, and neither value changes while the app is running
+_SHOW_TOOL_LOGGING = os.getenv("MQ_SHOW_TOOL_LOGGING", "true").lower() == "true"
+_BASE_URL = os.getenv("MQ_URL_BASE", "https://localhost:9443/ibmmq/rest/v3/admin/")
+
+# Static endpoints for the no-argument cases
+_DSPMQ_URL = f"{_BASE_URL}qmgr/"
+_DSPMQVER_URL = f"{_BASE_URL}installation"
+
+# Base URL split once so auto-routed URLs are assembled from parts instead of
+# scanning the whole string with str.replace per call; this also routes
+# correctly when the configured host isn't literally "localhost"
+_URL_PARTS = urlsplit(_BASE_URL)
+_URL_PORT = f":{_URL_PARTS.port}" if _URL_PARTS.port else ""
+
+
+def _routed_base(host: str) -> str:
+    """Base URL with its host swapped for the routing target."""
+    return f"{_URL_PARTS.scheme}://{host}{_URL_PORT}{_URL_PARTS.path}"
+
+
 def should_show_logging() -> bool:
-    """Check if tool logging should be displayed based on environment variable."""
-    return os.getenv("MQ_SHOW_TOOL_LOGGING", "true").lower() == "true"
+    """Check if tool logging should be displayed (read from env once at import)."""
+    return _SHOW_TOOL_LOGGING
 
 
 def get_rest_api_url(tool_name: str, args: dict) -> str:
@@ -24,6 +48,8 @@ def get_rest_api_url(tool_name: str, args: dict) -> str:
     Construct the IBM MQ REST API URL for a given tool call.
 
     Matches the logic from DynamicMQClient._get_rest_api_url() to ensure consistency.
+    Results are memoized per (tool name, sorted args) — the transcript re-renders
+    the same tool calls on every rerun, so the string building only happens once.
 
     Args:
         tool_name: Name of the MCP tool being called
@@ -32,32 +58,78 @@ def get_rest_api_url(tool_name: str, args: dict) -> str:
     Returns:
         REST API endpoint URL or file path for CSV-based tools
     """
-    base_url = os.getenv("MQ_URL_BASE", "https://localhost:9443/ibmmq/rest/v3/admin/")
+    return _build_rest_api_url(tool_name, tuple(sorted(args.items())))
+
+
+def _build_rest_api_url(tool_name: str, args_items: tuple) -> str:
+    args = dict(args_items)
 
     if tool_name == "dspmq":
         qmgr = args.get('qmgr_name')
         if qmgr:
-            url_with_qmgr_host = base_url.replace('localhost', qmgr)
-            return f"{url_with_qmgr_host}qmgr/ (Auto-routed)"
-        return f"{base_url}qmgr/"
+            return f"{_routed_base(qmgr)}qmgr/ (Auto-routed)"
+        return _DSPMQ_URL
     elif tool_name == "dspmqver":
         qmgr = args.get('qmgr_name')
         if qmgr:
-            url_with_qmgr_host = base_url.replace('localhost', qmgr)
-            return f"{url_with_qmgr_host}installation (Auto-routed)"
-        return f"{base_url}installation"
+            return f"{_routed_base(qmgr)}installation (Auto-routed)"
+        return _DSPMQVER_URL
     elif tool_name == "runmqsc":
         qmgr = args.get('qmgr_name', 'UNKNOWN')
         host = args.get('hostname')
         if host:
             # AI explicitly passed a host from search results
-            url_with_actual_host = base_url.replace('localhost', host)
-            return f"{url_with_actual_host}action/qmgr/{qmgr}/mqsc"
+            return f"{_routed_base(host)}action/qmgr/{qmgr}/mqsc"
         else:
             # Fallback display: use QM name as host (most common in small labs)
-            url_with_qmgr_host = base_url.replace('localhost', qmgr)
-            return f"{url_with_qmgr_host}action/qmgr/{qmgr}/mqsc (Auto-routed)"
+            return f"{_routed_base(qmgr)}action/qmgr/{qmgr}/mqsc (Auto-routed)"
     elif tool_name == "find_mq_object":
         return "[CSV File] resources/qmgr_dump.csv"
     else:
         return "Unknown endpoint"
+
+
+if STREAMLIT_AVAILABLE:
+    _build_rest_api_url = st.cache_data(show_spinner=False)(_build_rest_api_url)
+else:
+    # Same memoization outside Streamlit (tests, scripts): the hashable
+    # (tool_name, args_items) key makes this a drop-in lru_cache target
+    _build_rest_api_url = functools.lru_cache(maxsize=256)(_build_rest_api_url)
+
+
+def render_tools_used(tools_used: list, usage: dict | None = None,
+                      title: str = "🔧 Tools Used (in order)", container=None):
+    """
+    Render the tools-used log as a single table inside one expander.
+
+    Building one DataFrame and emitting it with st.dataframe issues a single
+    widget call per message instead of 4-6 per tool, which keeps reruns cheap
+    for long multi-tool AI turns.
+
+    Args:
+        tools_used: List of {"name": ..., "args": ...} dicts in call order
+        usage: Optional token usage dict to show below the table
+        title: Expander label
+        container: Optional Streamlit container (e.g. from st.empty()) to render into
+    """
+    if not STREAMLIT_AVAILABLE or not tools_used:
+        return
+
+    import pandas as pd
+
+    rows = [
+        {
+            "Step": idx,
+            "Tool": tool["name"],
+            "Args": json.dumps(tool.get("args", {})),
+            "Endpoint": get_rest_api_url(tool["name"], tool.get("args", {})),
+        }
+        for idx, tool in enumerate(tools_used, 1)
+    ]
+
+    target = container if container is not None else st
+    with target.expander(title):
+        st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+        if usage:
+            st.divider()
+            st.caption(f"📊 **Token Usage:** {usage.get('total_tokens', 0)} total ({usage.get('prompt_tokens', 0)} prompt, {usage.get('completion_tokens', 0)} completion)")
@@ -1,26 +1,57 @@
 import asyncio
 import base64
+import importlib.util
 import json
 import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
 import httpx
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+# orjson moves REST payloads to and from bytes ~2-3x faster than stdlib
+# json; fall back to the stdlib so the server still runs without it
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 # ---------------------------------------------------------------------------
 # Environment variables and Logging
 # ---------------------------------------------------------------------------
-# Try to find .env in cwd or one level up (handles different launch paths)
-env_path = os.path.join(os.getcwd(), ".env")
-if not os.path.exists(env_path):
-    env_path = os.path.join(os.path.dirname(os.getcwd()), ".env")
+# Resolve .env against cwd, its parent, then the project root anchored to
+# this file — the last candidate is stable however the server is launched
+_ENV_LOADED = False
+
+
+def _load_env_once() -> str:
+    """Locate and load .env a single time, even if the module is re-entered."""
+    global _ENV_LOADED
+    candidates = (
+        Path.cwd() / ".env",
+        Path.cwd().parent / ".env",
+        Path(__file__).resolve().parent.parent / ".env",
+    )
+    found = next((c for c in candidates if c.exists()), candidates[-1])
+    if not _ENV_LOADED:
+        load_dotenv(dotenv_path=found)
+        _ENV_LOADED = True
+    return str(found)
+
 
-load_dotenv(dotenv_path=env_path)
+env_path = _load_env_once()
 
 # ---------------------------------------------------------------------------
 # Configure Logging Setup
@@ -44,9 +75,16 @@ logger.debug("Target MQ User: %s", USER_NAME)
 if not URL_BASE or not USER_NAME:
     logger.error("CRITICAL: MQ_URL_BASE or MQ_USER_NAME is not set in .env")
 
-# Allowed hostname prefixes for safety (excludes production)
+# Allowed hostname prefixes for safety (excludes production) — normalized
+# to a lowercase tuple once so no call site re-lowercases per check
 ALLOWED_PREFIXES_STR = os.getenv("MQ_ALLOWED_HOSTNAME_PREFIXES", "lod,loq,lot")
-ALLOWED_HOSTNAME_PREFIXES = [p.strip() for p in ALLOWED_PREFIXES_STR.split(",")]
+ALLOWED_HOSTNAME_PREFIXES = tuple(p.strip().lower() for p in ALLOWED_PREFIXES_STR.split(","))
+
+# The allow-list folded into one anchored alternation — a single C-level
+# match per check instead of a Python startswith loop over the prefixes
+_ALLOWED_HOSTNAME_RE = re.compile(
+    "^(" + "|".join(re.escape(p) for p in ALLOWED_HOSTNAME_PREFIXES) + ")"
+)
 
 # Standard CSRF token value accepted by IBM MQ REST API (any non-empty value works)
 _CSRF_TOKEN = "token"
@@ -73,10 +111,27 @@ def get_http_client() -> httpx.AsyncClient:
     global _HTTP_CLIENT
     if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
         auth = httpx.BasicAuth(username=USER_NAME, password=PASSWORD)
-        _HTTP_CLIENT = httpx.AsyncClient(verify=False, auth=auth, timeout=30.0)
+        _HTTP_CLIENT = httpx.AsyncClient(
+            verify=False,
+            auth=auth,
+            timeout=30.0,
+            # Keep idle connections to recently queried hosts open so
+            # repeat tool calls skip TCP+TLS setup entirely
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            # HTTP/2 multiplexing when the optional h2 package is present
+            http2=importlib.util.find_spec("h2") is not None,
+        )
     return _HTTP_CLIENT
 
 
+async def close_http_client() -> None:
+    """Close the shared HTTP client pool (registered as a shutdown hook)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None and not _HTTP_CLIENT.is_closed:
+        await _HTTP_CLIENT.aclose()
+    _HTTP_CLIENT = None
+
+
 def _is_modification_command(mqsc_command: str) -> bool:
     """Return True if the MQSC command would modify queue-manager configuration."""
     first_word = mqsc_command.strip().split()[0].upper() if mqsc_command.strip() else ""
@@ -104,12 +159,93 @@ MCP_SSL_CERTFILE = os.getenv("MCP_SSL_CERTFILE", "")
 MCP_SSL_KEYFILE = os.getenv("MCP_SSL_KEYFILE", "")
 
 # ---------------------------------------------------------------------------
-# CSV helpers — cached at module level so disk is only read once per startup
+# CSV helpers — cached at module level and keyed on file mtime, so disk is
+# only re-read when the dump itself is replaced
 # ---------------------------------------------------------------------------
 CSV_PATH = Path(project_root) / "resources" / "qmgr_dump.csv"
 
 _CSV_CACHE: pd.DataFrame | None = None
 
+# pyarrow's multithreaded C++ CSV reader when installed
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# The columns the tools actually read — wider dumps are trimmed at parse
+# time instead of materializing columns nothing looks at
+_WANTED_COLUMNS = ("extractedat", "hostname", "qmname", "objecttype", "objectdef")
+
+
+def _columns_to_read() -> list[str] | None:
+    """Intersect _WANTED_COLUMNS with the file header (one-line sniff)."""
+    try:
+        with open(CSV_PATH, encoding="utf-8") as fh:
+            header = [c.strip() for c in fh.readline().split("|")]
+    except OSError:
+        return None
+    cols = [c for c in header if c in _WANTED_COLUMNS]
+    return cols or None
+
+
+def _read_csv_arrow() -> pd.DataFrame:
+    """Parse the dump with pyarrow: native tokenizing and whitespace trimming."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+
+    table = pacsv.read_csv(
+        CSV_PATH,
+        parse_options=pacsv.ParseOptions(delimiter="|"),
+        convert_options=pacsv.ConvertOptions(
+            strings_can_be_null=True,
+            include_columns=_columns_to_read(),
+            # Known schema — skip the type-inference pass; extractedat is
+            # left to infer so it still arrives date-typed
+            column_types={
+                "hostname": pa.string(),
+                "qmname": pa.string(),
+                "objecttype": pa.string(),
+                "objectdef": pa.string(),
+            },
+        ),
+    )
+    # Trim string columns in vectorized C++ instead of a Python call per cell
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type):
+            table = table.set_column(i, field, pc.utf8_trim_whitespace(table.column(i)))
+    # Keep Arrow-backed dtypes: the str.upper/lower/startswith/contains work
+    # downstream dispatches to Arrow compute kernels, and the strings stay
+    # in compact Arrow buffers instead of per-cell Python objects
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _read_csv_pandas() -> pd.DataFrame:
+    """Fallback parse with pandas when pyarrow isn't installed."""
+    df = pd.read_csv(
+        CSV_PATH,
+        delimiter="|",
+        skipinitialspace=True,
+        header=0,
+        engine="c",
+        low_memory=False,
+        usecols=_columns_to_read(),
+        # Known schema — the C parser skips its per-column inference pass
+        dtype={
+            "hostname": "string",
+            "qmname": "string",
+            "objecttype": "string",
+            "objectdef": "string",
+        },
+    )
+    # Strip column-wise through pandas' C string path — df.map dispatched a
+    # Python isinstance/strip call for every cell
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        df[col] = df[col].str.strip()
+    return df
+
+
+# Binary sidecar written after the first parse — later startups memory-map
+# the Arrow IPC file instead of re-tokenizing the text CSV
+_FEATHER_CACHE_PATH = CSV_PATH.with_suffix(".feather")
+
 
 def _load_csv_from_disk() -> pd.DataFrame:
     """Read and parse the qmgr_dump CSV from disk."""
@@ -117,16 +253,32 @@ def _load_csv_from_disk() -> pd.DataFrame:
         logger.warning("CSV file not found at %s", CSV_PATH)
         return pd.DataFrame()
 
+    if _HAS_PYARROW and _FEATHER_CACHE_PATH.exists():
+        try:
+            if _FEATHER_CACHE_PATH.stat().st_mtime >= CSV_PATH.stat().st_mtime:
+                df = pd.read_feather(_FEATHER_CACHE_PATH)
+                # A sidecar written by an older build may predate some of
+                # the derived columns — reparse rather than serve a frame
+                # the search path can't use
+                if {"qmgr_upper", "object_type_upper", "hostname_allowed", "_search_blob"} <= set(df.columns):
+                    # The allow-list verdict depends on the environment, not
+                    # the CSV — a sidecar written under a different
+                    # MQ_ALLOWED_HOSTNAME_PREFIXES would otherwise serve
+                    # stale verdicts, so recompute it (one vectorized pass)
+                    if "hostname" in df.columns:
+                        df["hostname_allowed"] = df["hostname"].str.lower().str.startswith(ALLOWED_HOSTNAME_PREFIXES)
+                    logger.info(
+                        "Loaded %d rows from feather cache %s",
+                        len(df), _FEATHER_CACHE_PATH.name,
+                    )
+                    return df
+                logger.info("Feather cache missing derived columns — reparsing CSV")
+        except Exception:
+            logger.warning("Unreadable feather cache — reparsing CSV", exc_info=True)
+
     try:
-        df = pd.read_csv(
-            CSV_PATH,
-            delimiter="|",
-            skipinitialspace=True,
-            header=0,
-        )
-        # Strip whitespace from all string columns and column names
+        df = _read_csv_arrow() if _HAS_PYARROW else _read_csv_pandas()
         df.columns = [c.strip() for c in df.columns]
-        df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
 
         df = df.rename(columns={
             "qmname":     "qmgr",
@@ -135,22 +287,135 @@ def _load_csv_from_disk() -> pd.DataFrame:
         })
         if "extractedat" in df.columns:
             df["extractedat"] = pd.to_datetime(df["extractedat"], errors="coerce")
+
+        # Derived columns materialized once per load — every search and QMGR
+        # lookup otherwise re-uppercases and re-checks the same strings
+        if "object_type" in df.columns:
+            df["object_type_upper"] = df["object_type"].str.upper()
+        if "qmgr" in df.columns:
+            df["qmgr_upper"] = df["qmgr"].str.upper()
+        if "hostname" in df.columns:
+            df["hostname_allowed"] = df["hostname"].str.lower().str.startswith(ALLOWED_HOSTNAME_PREFIXES)
+
+        # One lowercase haystack per row — the fallback scan then does a
+        # single case-sensitive pass with the plain C substring finder
+        # instead of four case-folding regex passes over separate columns
+        blob_cols = [c for c in ("hostname", "qmgr", "object_type", "mqsc_command") if c in df.columns]
+        if blob_cols:
+            blob = df[blob_cols[0]].astype(str).str.lower()
+            for c in blob_cols[1:]:
+                blob = blob + "|" + df[c].astype(str).str.lower()
+            df["_search_blob"] = blob
         logger.info("CSV loaded successfully: %d rows, %d columns", len(df), len(df.columns))
         logger.debug("Columns: %s", list(df.columns))
+
+        # Persist the fully processed frame (renames + derived columns) so
+        # the next startup skips parsing entirely — best effort, the
+        # resources directory may be read-only
+        if _HAS_PYARROW:
+            try:
+                df.to_feather(_FEATHER_CACHE_PATH)
+            except Exception:
+                logger.debug("Could not write feather cache", exc_info=True)
         return df
     except Exception:
         logger.exception("ERROR loading CSV")
         return pd.DataFrame()
 
 
+_CSV_CACHE_MTIME: float | None = None
+
+
 def load_csv() -> pd.DataFrame:
-    """Return the cached CSV dataframe, loading from disk on first call."""
-    global _CSV_CACHE
-    if _CSV_CACHE is None:
+    """Return the cached CSV dataframe, reloading only when the file changes.
+
+    The stat call is the only per-invocation cost; a fresh dump dropped in
+    place is picked up without a server restart, and everything derived
+    from the frame is invalidated alongside it.
+    """
+    global _CSV_CACHE, _CSV_CACHE_MTIME
+    try:
+        mtime = CSV_PATH.stat().st_mtime
+    except OSError:
+        mtime = None
+    if _CSV_CACHE is None or mtime != _CSV_CACHE_MTIME:
         _CSV_CACHE = _load_csv_from_disk()
+        _CSV_CACHE_MTIME = mtime
+        _invalidate_derived_caches()
     return _CSV_CACHE
 
 
+def _invalidate_derived_caches() -> None:
+    """Drop structures derived from the frame so they rebuild lazily."""
+    global _CSV_INDEX, _INDEX_TOKEN_BLOB, _QMGR_HOST, _RECORDS_JSON
+    _CSV_INDEX = None
+    _INDEX_TOKEN_BLOB = None
+    _QMGR_HOST = None
+    _RECORDS_JSON = None
+
+
+# Inverted token index over the searchable columns, built lazily on first
+# search. Full names (queues, channels, QMGRs, hosts) resolve by dict lookup
+# instead of regex-scanning four columns of the whole manifest.
+_CSV_INDEX: dict[str, list[int]] | None = None
+
+# All index tokens joined newline-delimited — lets the search prove in two
+# C substring counts whether an exact-token hit is exhaustive (see
+# _index_hit_is_exhaustive) before trusting it over the full scan
+_INDEX_TOKEN_BLOB: str | None = None
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_.]+")
+
+
+def _build_search_index(df: pd.DataFrame) -> dict[str, list[int]]:
+    """Map lowercased tokens to row positions for O(1) exact-name lookups."""
+    index: dict[str, set[int]] = {}
+    cols = [c for c in ("qmgr", "hostname", "mqsc_command", "object_type") if c in df.columns]
+    for pos, row in enumerate(df[cols].itertuples(index=False)):
+        for value in row:
+            for token in _TOKEN_RE.findall(str(value).lower()):
+                index.setdefault(token, set()).add(pos)
+    return {token: sorted(rows) for token, rows in index.items()}
+
+
+def _get_search_index() -> dict[str, list[int]]:
+    global _CSV_INDEX, _INDEX_TOKEN_BLOB
+    if _CSV_INDEX is None:
+        _CSV_INDEX = _build_search_index(load_csv())
+        _INDEX_TOKEN_BLOB = "\n" + "\n".join(_CSV_INDEX) + "\n"
+    return _CSV_INDEX
+
+
+def _index_hit_is_exhaustive(term: str) -> bool:
+    """True when the term occurs in no longer token, so the exact-token hit
+    already covers every row the substring scan could find (a term like
+    "qm1" also living inside "qm1.to.qm2" would make the index hit lossy).
+    """
+    blob = _INDEX_TOKEN_BLOB or ""
+    return blob.count(term) == blob.count(f"\n{term}\n")
+
+
+# QMGR → hostname map built once from the manifest; dspmq/dspmqver/runmqsc
+# otherwise re-ran a full-column equality scan per invocation
+_QMGR_HOST: dict[str, str] | None = None
+
+
+def _get_qmgr_host_map() -> dict[str, str]:
+    global _QMGR_HOST
+    if _QMGR_HOST is None:
+        df = load_csv()
+        if df.empty or "qmgr_upper" not in df.columns:
+            _QMGR_HOST = {}
+        else:
+            # keep="first" matches the old iloc[0] pick when a QMGR appears
+            # on several manifest rows
+            dedup = df.drop_duplicates(subset="qmgr_upper", keep="first")
+            _QMGR_HOST = dict(
+                zip(dedup["qmgr_upper"], dedup["hostname"].astype(str).str.strip())
+            )
+    return _QMGR_HOST
+
+
 # ---------------------------------------------------------------------------
 # Hostname allow-list guard
 # ---------------------------------------------------------------------------
@@ -159,10 +424,8 @@ def is_hostname_allowed(hostname: str) -> tuple[bool, str]:
     Check if a hostname is allowed based on prefix filtering.
     Returns (True, "") if allowed, or (False, "reason message") if blocked.
     """
-    hostname_lower = hostname.lower().strip()
-    for prefix in ALLOWED_HOSTNAME_PREFIXES:
-        if hostname_lower.startswith(prefix.lower()):
-            return True, ""
+    if _ALLOWED_HOSTNAME_RE.match(hostname.lower().strip()):
+        return True, ""
 
     allowed_list = ", ".join(ALLOWED_HOSTNAME_PREFIXES)
     message = (
@@ -295,25 +558,29 @@ mcp = FastMCP("mqmcpserver", host=mcp_host, port=mcp_port)
 
 
 @mcp.tool()
-def find_mq_object(search_string: str, object_type: str | None = None) -> str:
+async def find_mq_object(search_string: str, object_type: str | None = None) -> str:
     """
     Search QM dump for a string to find which QM hosts an object.
     Returns the queue manager name(s), hostname(s), and object type.
-    
+
     TIP: For end-to-end workflows, prefer the composite tools instead:
     - run_mqsc_for_object: auto-searches then runs any MQSC command
     - get_queue_depth: auto-searches, resolves aliases, returns depth
     - get_channel_status: auto-searches then returns channel status
-    
+
     Args:
         search_string: String to search (e.g., queue name)
         object_type: Optional filter (e.g., 'QLOCAL', 'QUEUES', 'CHANNEL')
     """
-    results = _search_objects_structured(search_string, object_type)
+    # The pandas scan is CPU-bound; run it off the event loop so other
+    # in-flight tool calls keep being serviced during a big search
+    results = await asyncio.to_thread(
+        _search_objects_structured, search_string, object_type
+    )
 
     if not results:
         # Check if the object exists at all (without type filter) to give a better message
-        if object_type and _search_objects_structured(search_string):
+        if object_type and await asyncio.to_thread(_search_objects_structured, search_string):
             return f"❌ '{search_string}' exists but is not of type '{object_type}'."
         return f"❌ '{search_string}' not found in the manifest."
 
@@ -338,13 +605,63 @@ def find_mq_object(search_string: str, object_type: str | None = None) -> str:
     return "\n".join(output_lines)
 
 
+# Records-JSON of the manifest, serialized once through pandas' C writer —
+# building one Python dict per row on every read is allocation-heavy
+_RECORDS_JSON: str | None = None
+
+
+@mcp.resource("manifest://qmgr_dump", mime_type="application/json")
+def get_qmgr_dump() -> str:
+    """The full qmgr manifest as JSON records (one object per CSV row)."""
+    global _RECORDS_JSON
+    if _RECORDS_JSON is None:
+        _RECORDS_JSON = load_csv().to_json(orient="records", date_format="iso")
+    return _RECORDS_JSON
+
+
+# ---------------------------------------------------------------------------
+# Short-TTL cache for inventory lookups (dspmq / dspmqver)
+# ---------------------------------------------------------------------------
+# Queue-manager inventory and version info don't change within seconds, but
+# the clients re-ask for them constantly (connect probes, page reruns, agent
+# fan-outs). A tiny TTL cache with single-flight locking means N concurrent
+# identical requests collapse onto one REST call.
+_INVENTORY_TTL = 5.0
+_inventory_cache: dict[tuple, tuple[float, str]] = {}
+_inventory_locks: dict[tuple, asyncio.Lock] = {}
+
+
+async def _cached_inventory_call(key: tuple, fetch) -> str:
+    """Serve from the short-TTL cache, collapsing concurrent misses to one fetch."""
+    entry = _inventory_cache.get(key)
+    if entry and time.monotonic() - entry[0] < _INVENTORY_TTL:
+        return entry[1]
+    lock = _inventory_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # A waiter that queued behind the first miss finds the fresh entry here
+        entry = _inventory_cache.get(key)
+        if entry and time.monotonic() - entry[0] < _INVENTORY_TTL:
+            return entry[1]
+        result = await fetch()
+        # Don't pin failures — the next request should retry upstream
+        if "❌" not in result and "🚫" not in result:
+            _inventory_cache[key] = (time.monotonic(), result)
+        return result
+
+
 @mcp.tool()
 async def dspmq(qmgr_name: str | None = None) -> str:
     """List all IBM MQ queue managers and their status.
-    
+
     Args:
         qmgr_name: Optional queue manager name to list all QMs running on its host.
     """
+    key = ("dspmq", (qmgr_name or "").upper())
+    return await _cached_inventory_call(key, lambda: _dspmq_fetch(qmgr_name))
+
+
+async def _dspmq_fetch(qmgr_name: str | None = None) -> str:
+    """Uncached dspmq — one REST round-trip to the target host."""
     headers = {
         "Content-Type": "application/json",
         "ibm-mq-rest-csrf-token": _CSRF_TOKEN,
@@ -353,10 +670,8 @@ async def dspmq(qmgr_name: str | None = None) -> str:
     target_hostname = ""
     url = URL_BASE + "qmgr/"
     if qmgr_name:
-        df = load_csv()
-        qmgr_matches = df[df["qmgr"].str.upper() == qmgr_name.upper()]
-        if not qmgr_matches.empty:
-            target_hostname = str(qmgr_matches.iloc[0]["hostname"]).strip()
+        target_hostname = _get_qmgr_host_map().get(qmgr_name.upper(), "")
+        if target_hostname:
             allowed, message = is_hostname_allowed(target_hostname)
             if not allowed:
                 return message
@@ -374,7 +689,7 @@ async def dspmq(qmgr_name: str | None = None) -> str:
 
 
 def prettify_dspmq(payload: bytes) -> str:
-    json_output = json.loads(payload.decode("utf-8"))
+    json_output = _json_loads(payload)
     lines = []
     for x in json_output["qmgr"]:
         lines.append(f"name={x['name']}, state={x['state']}")
@@ -388,6 +703,12 @@ async def dspmqver(qmgr_name: str | None = None) -> str:
     Args:
         qmgr_name: Optional queue manager name to check the specific host version for.
     """
+    key = ("dspmqver", (qmgr_name or "").upper())
+    return await _cached_inventory_call(key, lambda: _dspmqver_fetch(qmgr_name))
+
+
+async def _dspmqver_fetch(qmgr_name: str | None = None) -> str:
+    """Uncached dspmqver — one REST round-trip to the target host."""
     headers = {
         "Content-Type": "application/json",
         "ibm-mq-rest-csrf-token": _CSRF_TOKEN,
@@ -397,10 +718,8 @@ async def dspmqver(qmgr_name: str | None = None) -> str:
     target_hostname = ""
     url = URL_BASE + "installation"
     if qmgr_name:
-        df = load_csv()
-        qmgr_matches = df[df["qmgr"].str.upper() == qmgr_name.upper()]
-        if not qmgr_matches.empty:
-            target_hostname = str(qmgr_matches.iloc[0]["hostname"]).strip()
+        target_hostname = _get_qmgr_host_map().get(qmgr_name.upper(), "")
+        if target_hostname:
             allowed, message = is_hostname_allowed(target_hostname)
             if not allowed:
                 return message
@@ -417,8 +736,24 @@ async def dspmqver(qmgr_name: str | None = None) -> str:
         return _friendly_error(err, hostname=target_hostname)
 
 
+@mcp.tool()
+async def dspmq_and_ver(qmgr_name: str | None = None) -> str:
+    """Queue manager inventory AND version info in a single call.
+
+    Runs dspmq and dspmqver concurrently so the two independent REST
+    round-trips overlap instead of executing back to back.
+
+    Args:
+        qmgr_name: Optional queue manager name to scope both reports to its host.
+    """
+    inventory, version = await asyncio.gather(
+        dspmq(qmgr_name), dspmqver(qmgr_name)
+    )
+    return f"=== dspmq ===\n{inventory}\n\n=== dspmqver ===\n{version}"
+
+
 def prettify_dspmqver(payload: bytes) -> str:
-    json_output = json.loads(payload.decode("utf-8"))
+    json_output = _json_loads(payload)
     lines = ["\n---"]
     for x in json_output["installation"]:
         lines.append(
@@ -458,9 +793,9 @@ async def runmqsc(qmgr_name: str, mqsc_command: str, hostname: str | None = None
     }
 
     # Hostname resolution logic
-    df = load_csv()
+    qmgr_hosts = _get_qmgr_host_map()
     target_hostname = qmgr_name  # Default fallback (restored to QM name)
-    
+
     if hostname:
         # Use provided hostname directly
         target_hostname = hostname.strip()
@@ -468,47 +803,92 @@ async def runmqsc(qmgr_name: str, mqsc_command: str, hostname: str | None = None
         allowed, message = is_hostname_allowed(target_hostname)
         if not allowed:
             return message
-    elif not df.empty:
+    elif qmgr_hosts:
         # Fallback to manifest lookup
-        qmgr_matches = df[df["qmgr"].str.upper() == qmgr_name.upper()]
-        if not qmgr_matches.empty:
-            target_hostname = str(qmgr_matches.iloc[0]["hostname"]).strip()
+        mapped_host = qmgr_hosts.get(qmgr_name.upper())
+        if mapped_host:
+            target_hostname = mapped_host
             allowed, message = is_hostname_allowed(target_hostname)
             if not allowed:
                 return message
         else:
             logger.warning("QM %s not found in manifest, using as hostname", qmgr_name)
 
-    # Use json.dumps to safely serialise the command
-    data = json.dumps({"type": "runCommand", "parameters": {"command": mqsc_command}})
+    # Serialise the command safely, straight to the bytes httpx sends
+    data = _json_dumps({"type": "runCommand", "parameters": {"command": mqsc_command}})
 
     url = _build_url(target_hostname, "action/qmgr/" + qmgr_name + "/mqsc")
 
     client = get_http_client()
     try:
-        response = await client.post(url, data=data, headers=headers, timeout=30.0)
+        response = await client.post(url, content=data, headers=headers, timeout=30.0)
         response.raise_for_status()
         return prettify_runmqsc(response.content)
     except Exception as err:
         return _friendly_error(err, hostname=target_hostname)
 
 
+@mcp.tool()
+async def runmqsc_many(qmgr_names: list[str], mqsc_command: str) -> str:
+    """Run a read-only MQSC command on several queue managers concurrently.
+
+    Use this instead of repeated runmqsc calls when the same command needs
+    to go to multiple queue managers (e.g. cluster-wide depth checks) —
+    the REST calls are issued in parallel, so wall-clock is roughly one
+    round-trip instead of one per queue manager.
+
+    NOTE: Only DISPLAY commands are allowed, same as runmqsc.
+
+    Args:
+        qmgr_names:   Queue manager names to run the command on
+        mqsc_command: An MQSC command to run on each queue manager
+    """
+    if not qmgr_names:
+        return "❌ No queue manager names provided."
+    if _is_modification_command(mqsc_command):
+        logger.warning(
+            "Blocked modification command: %s (qmgrs=%s)",
+            mqsc_command, qmgr_names,
+        )
+        return _MODIFY_BLOCKED_MSG
+
+    # Each leg reuses runmqsc's hostname resolution and allow-list check;
+    # gather overlaps the round-trips over the pooled client
+    results = await asyncio.gather(
+        *(runmqsc(name, mqsc_command) for name in qmgr_names),
+        return_exceptions=True,
+    )
+    sections = []
+    for name, result in zip(qmgr_names, results):
+        body = f"❌ Error: {result}" if isinstance(result, BaseException) else result
+        sections.append(f"=== {name} ===\n{body}")
+    return "\n\n".join(sections)
+
+
+# z/OS command responses open with this message id; checked per response
+_CSQ_PREFIX = "CSQN205I"
+
+# Headers to strip from the beginning of MQSC response lines
+_STRIP_HEADERS = (
+    "AMQ8409I: Display Queue details.",
+    "AMQ8450I: Display Channel details.",
+    "AMQ8420I: Display Queue Manager details.",
+)
+
+# Multi-attribute MQSC lines are separated by runs of 2+ spaces; compiled
+# once here instead of hitting the regex cache on every response line
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+
+
 def prettify_runmqsc(payload: bytes) -> str:
     """Format MQSC command response for both z/OS and distributed queue managers."""
-    json_output = json.loads(payload.decode("utf-8"))
+    json_output = _json_loads(payload)
     lines = []
-    
-    # Headers to strip from the beginning of lines
-    STRIP_HEADERS = [
-        "AMQ8409I: Display Queue details.",
-        "AMQ8450I: Display Channel details.",
-        "AMQ8420I: Display Queue Manager details."
-    ]
 
     for x in json_output.get("commandResponse", []):
         text_list = x.get("text", [])
         # z/OS responses start with CSQN205I
-        if text_list and text_list[0].startswith("CSQN205I"):
+        if text_list and text_list[0].startswith(_CSQ_PREFIX):
             text_list.pop(0)
             if text_list: text_list.pop()
             for y in text_list:
@@ -523,18 +903,20 @@ def prettify_runmqsc(payload: bytes) -> str:
                 if line_s[0].isdigit() and " : " in line_s:
                     continue
                 
-                # 2. Strip known headers from start of line
-                for h in STRIP_HEADERS:
-                    if line_s.startswith(h):
-                        line_s = line_s[len(h):].strip()
-                        break
+                # 2. Strip known headers from start of line — the tuple
+                # startswith rejects the common non-header line in one call
+                if line_s.startswith(_STRIP_HEADERS):
+                    for h in _STRIP_HEADERS:
+                        if line_s.startswith(h):
+                            line_s = line_s[len(h):].strip()
+                            break
                 
                 if not line_s:
                     continue
                 
                 # 3. Handle data-rich lines: Split multi-attribute lines (separated by 2+ spaces)
                 # This also fixes the "one long line" problem on some platforms
-                parts = [p.strip() for p in re.split(r'\s{2,}', line_s) if p.strip()]
+                parts = [p.strip() for p in _MULTISPACE_RE.split(line_s) if p.strip()]
                 lines.extend(parts)
     
     if not lines:
@@ -548,6 +930,28 @@ def prettify_runmqsc(payload: bytes) -> str:
 # ---------------------------------------------------------------------------
 
 
+# Below this row count the thread-pool handoff costs more than it saves;
+# today's dump is well under it, so small manifests stay on one thread
+_PARALLEL_SCAN_MIN_ROWS = 50_000
+
+
+def _contains_mask(frame: pd.DataFrame, cols: list[str], pattern: re.Pattern) -> np.ndarray:
+    """OR of per-column substring scans, threaded for large manifests.
+
+    The regex engine releases the GIL inside each column scan, so on big
+    dumps the per-column passes genuinely overlap across cores.
+    """
+    def scan(col: str) -> np.ndarray:
+        return frame[col].astype(str).str.contains(pattern, na=False).to_numpy()
+
+    if len(frame) >= _PARALLEL_SCAN_MIN_ROWS and len(cols) > 1:
+        with ThreadPoolExecutor(max_workers=min(4, len(cols))) as pool:
+            masks = list(pool.map(scan, cols))
+    else:
+        masks = [scan(col) for col in cols]
+    return np.logical_or.reduce(masks)
+
+
 def _search_objects_structured(
     search_string: str, object_type: str | None = None
 ) -> list[dict]:
@@ -559,22 +963,8 @@ def _search_objects_structured(
     if df.empty:
         return []
 
-    # Restrict search to relevant columns and use vectorized str.contains
-    # This is significantly faster than using .apply() across all columns
-    search_cols = [c for c in ["qmgr", "hostname", "mqsc_command", "object_type"] if c in df.columns]
-    
-    mask = pd.Series(False, index=df.index)
-    for col in search_cols:
-        mask |= df[col].astype(str).str.contains(
-            re.escape(search_string), case=False, na=False
-        )
-        
-    matches = df[mask]
-
-    if matches.empty:
-        return []
-
-    # Infer object type from naming convention if not provided
+    # Infer object type from naming convention if not provided — resolved
+    # up front so the type predicate can run before the expensive scan
     inf_type = object_type
     if not inf_type:
         s_upper = search_string.upper()
@@ -585,37 +975,79 @@ def _search_objects_structured(
         elif s_upper.startswith("QR."):
             inf_type = "QREMOTE"
 
-    # Apply type filter
-    if inf_type:
+    def apply_type_filter(frame: pd.DataFrame) -> pd.DataFrame:
+        if not inf_type:
+            return frame
         inf_upper = inf_type.upper()
         if inf_upper == "QUEUES":
             queue_types = ["QLOCAL", "QREMOTE", "QMODEL", "QALIAS"]
-            matches = matches[
-                matches["object_type"].str.upper().isin(queue_types)
+            return frame[frame["object_type_upper"].isin(queue_types)]
+        return frame[frame["object_type_upper"] == inf_upper]
+
+    # Exact-token fast path: a full object/QMGR/host name hits the inverted
+    # index built at load time — a dict lookup instead of scanning four
+    # columns of the whole manifest. Taken only when provably exhaustive:
+    # if the term also occurs inside a longer token (e.g. "QM1" within
+    # "QM1.TO.QM2"), the substring scan can find rows the exact-token hit
+    # misses, so partial and embedded names fall through to the scan.
+    term = search_string.strip().lower()
+    indexed_rows = _get_search_index().get(term)
+    if indexed_rows is not None and not _index_hit_is_exhaustive(term):
+        indexed_rows = None
+    if indexed_rows is not None:
+        # Index positions refer to the full frame; the hit set is small, so
+        # type-filter the picked rows afterwards
+        matches = apply_type_filter(df.iloc[indexed_rows])
+    else:
+        # Cheap equality filter first: with a type hint the regex scan only
+        # touches the rows of that type instead of the whole manifest
+        candidate = apply_type_filter(df)
+        if candidate.empty:
+            return []
+
+        if "_search_blob" in candidate.columns:
+            # Single pass over the precomputed lowercase haystack with the
+            # non-regex C substring finder — no per-query case folding
+            matches = candidate[
+                candidate["_search_blob"].str.contains(
+                    search_string.lower(), regex=False, na=False
+                )
             ]
         else:
-            matches = matches[
-                matches["object_type"].str.upper() == inf_upper
-            ]
+            # Restrict search to relevant columns and use vectorized str.contains
+            # This is significantly faster than using .apply() across all columns
+            search_cols = [c for c in ["qmgr", "hostname", "mqsc_command", "object_type"] if c in candidate.columns]
+
+            # Compile once per search — each column scan reuses the same pattern
+            # instead of re-escaping and re-compiling it
+            pattern = re.compile(re.escape(search_string), re.IGNORECASE)
+            matches = candidate[_contains_mask(candidate, search_cols, pattern)]
 
     if matches.empty:
         return []
 
-    # Deduplicate and build structured result
-    display = matches[["hostname", "qmgr", "object_type"]].drop_duplicates()
+    # Deduplicate with a plain set while zipping the columns — match sets
+    # are small here, and drop_duplicates would allocate an intermediate
+    # frame and hash rows through pandas machinery first. The allow-list
+    # verdict was computed per hostname at load time, no per-row check.
+    seen: set[tuple] = set()
     results = []
-    for _, r in display.iterrows():
-        hostname = str(r["hostname"]).strip()
-        allowed, _ = is_hostname_allowed(hostname)
+    for host, qmgr, obj_type, allowed in zip(
+        matches["hostname"], matches["qmgr"],
+        matches["object_type"], matches["hostname_allowed"],
+    ):
+        key = (host, qmgr, obj_type, allowed)
+        if key in seen:
+            continue
+        seen.add(key)
         results.append(
             {
-                "qmgr": str(r["qmgr"]).strip(),
-                "hostname": hostname,
-                "object_type": str(r["object_type"]).strip(),
+                "qmgr": str(qmgr).strip(),
+                "hostname": str(host).strip(),
+                "object_type": str(obj_type).strip(),
                 "restricted": not allowed,
             }
         )
-
     return results
 
 
@@ -631,7 +1063,7 @@ async def _run_mqsc_raw(
         "ibm-mq-rest-csrf-token": _CSRF_TOKEN,
     }
 
-    data = json.dumps(
+    data = _json_dumps(
         {"type": "runCommand", "parameters": {"command": mqsc_command}}
     )
 
@@ -640,7 +1072,7 @@ async def _run_mqsc_raw(
     client = get_http_client()
     try:
         response = await client.post(
-            url, data=data, headers=headers, timeout=30.0
+            url, content=data, headers=headers, timeout=30.0
         )
         response.raise_for_status()
         return prettify_runmqsc(response.content)
@@ -684,7 +1116,7 @@ async def run_mqsc_for_object(
         "run_mqsc_for_object called",
         extra={"context": {"object": object_name, "command": mqsc_command}},
     )
-    results = _search_objects_structured(object_name, object_type)
+    results = await asyncio.to_thread(_search_objects_structured, object_name, object_type)
 
     if not results:
         return f"❌ '{object_name}' not found in the manifest."
@@ -736,7 +1168,7 @@ async def get_queue_depth(queue_name: str) -> str:
         "get_queue_depth called",
         extra={"context": {"queue": queue_name}},
     )
-    results = _search_objects_structured(queue_name)
+    results = await asyncio.to_thread(_search_objects_structured, queue_name)
 
     if not results:
         return f"❌ '{queue_name}' not found in the manifest."
@@ -827,11 +1259,11 @@ async def get_channel_status(channel_name: str) -> str:
         extra={"context": {"channel": channel_name}},
     )
     # Try with CHANNEL type filter first
-    results = _search_objects_structured(channel_name, "CHANNEL")
+    results = await asyncio.to_thread(_search_objects_structured, channel_name, "CHANNEL")
 
     if not results:
         # Fallback: search without type filter
-        results = _search_objects_structured(channel_name)
+        results = await asyncio.to_thread(_search_objects_structured, channel_name)
 
     if not results:
         return f"❌ '{channel_name}' not found in the manifest."
@@ -989,6 +1421,9 @@ if __name__ == "__main__":
         import uvicorn
 
         app = mcp.sse_app()
+        # Drain the shared HTTP pool when uvicorn stops instead of letting
+        # pooled TLS connections drop mid-close
+        app.add_event_handler("shutdown", close_http_client)
         app = BasicAuthMiddleware(app, MCP_AUTH_USER, MCP_AUTH_PASSWORD)
         logger.info(
             "Starting SSE server with Basic Authentication (user: %s)",
@@ -1021,7 +1456,17 @@ if __name__ == "__main__":
         else:
             logger.info("Running over plain HTTP (no SSL configured).")
 
-        uvicorn.run(app, host=mcp_host, port=mcp_port, **ssl_kwargs)
+        # Prefer uvloop's C event loop and httptools' C HTTP parser when
+        # installed — uvicorn's "auto" does this too, but being explicit
+        # keeps the choice visible and logged. Workers stay at 1: SSE
+        # sessions and the inventory cache live in process memory, so
+        # forked workers would break session affinity.
+        import importlib.util
+        loop_impl = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+        http_impl = "httptools" if importlib.util.find_spec("httptools") else "h11"
+        logger.info("uvicorn stack: loop=%s http=%s", loop_impl, http_impl)
+
+        uvicorn.run(app, host=mcp_host, port=mcp_port, loop=loop_impl, http=http_impl, **ssl_kwargs)
     else:
         if transport == "sse" and not (MCP_AUTH_USER and MCP_AUTH_PASSWORD):
             logger.warning(
@@ -3,7 +3,6 @@ Test configuration and fixtures for MQ MCP tests
 """
 
 import pytest
-import asyncio
 import os
 import sys
 from pathlib import Path
@@ -11,12 +10,9 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-@pytest.fixture
-def event_loop():
-    """Create an event loop for async tests"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Async tests get their loop from pytest-asyncio (configured in pytest.ini);
+# the old hand-rolled event_loop fixture used a deprecated policy API and
+# allocated a fresh loop per test.
 
 @pytest.fixture
 def sample_qmgr_data():
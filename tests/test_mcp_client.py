@@ -67,6 +67,35 @@ def print_tools(tools) -> list[str]:
     return [t.name for t in tools]
 
 
+async def call_many(session: ClientSession, calls: list[tuple[str, dict]]):
+    """Fan several tool calls out concurrently over the one session.
+
+    The transport multiplexes requests, so wall-clock is roughly the slowest
+    individual call rather than the sum.
+    """
+    print(f"\n🔧 Running {len(calls)} calls concurrently...")
+    results = await asyncio.gather(
+        *(session.call_tool(name, args) for name, args in calls),
+        return_exceptions=True,
+    )
+    for (name, args), result in zip(calls, results):
+        print(f"\n--- {name}({json.dumps(args)}) ---")
+        if isinstance(result, BaseException):
+            print(f"❌ Error: {result}")
+            continue
+        for content in result.content:
+            if hasattr(content, "text"):
+                print(content.text)
+            else:
+                print(content)
+        if result.isError:
+            print("⚠️  Tool returned an error.")
+
+
+# Parameterless calls safe to batch as a connectivity smoke test
+SMOKE_BATTERY = [("dspmq", {}), ("dspmqver", {})]
+
+
 async def call_tool(session: ClientSession, tool_name: str, arguments: dict):
     """Call a tool and print the result."""
     print(f"\n🔧 Calling: {tool_name}({json.dumps(arguments)})")
@@ -106,6 +135,7 @@ async def interactive_mode():
 
                 print("\nType a tool name and JSON arguments to test:")
                 print("  list     — show all tools")
+                print("  smoke    — run dspmq + dspmqver concurrently")
                 print("  quit     — exit\n")
                 print('Example: find_mq_object {"search_string": "QL.IN.APP1"}')
                 print("Example: dspmq {}")
@@ -113,7 +143,9 @@ async def interactive_mode():
 
                 while True:
                     try:
-                        user_input = await asyncio.get_event_loop().run_in_executor(
+                        # input() runs in a worker thread so the loop keeps
+                        # servicing the SSE read task while the user types
+                        user_input = await asyncio.get_running_loop().run_in_executor(
                             None, lambda: input("mcp> ").strip()
                         )
                     except (EOFError, KeyboardInterrupt):
@@ -127,6 +159,10 @@ async def interactive_mode():
                         result = await session.list_tools()
                         print_tools(result.tools)
                         continue
+                    if user_input.lower() == "smoke":
+                        await call_many(session, SMOKE_BATTERY)
+                        print()
+                        continue
 
                     # Parse: tool_name {json_args}
                     parts = user_input.split(None, 1)
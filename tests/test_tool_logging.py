@@ -4,14 +4,27 @@ Test cases for tool transparency and logging
 
 import pytest
 import os
+import types
+
+# Shared endpoint literals — built once at import instead of re-allocated
+# inside every test body
+BASE_URL = "https://localhost:9443/ibmmq/rest/v3/admin/"
+MQSC_URL_TMPL = "https://{qm}:9443/ibmmq/rest/v3/admin/action/qmgr/{qm}/mqsc"
+
+# Resolved once at import, matching how tool_logger reads the env flag
+MQ_SHOW_TOOL_LOGGING = os.environ.get("MQ_SHOW_TOOL_LOGGING", "true").lower() == "true"
+
+# Canonical runmqsc arguments, shared read-only so no test rebuilds the dict
+_ARGS = types.MappingProxyType(
+    {"qmgr_name": "MQQMGR1", "mqsc_command": "DISPLAY QLOCAL(*)"}
+)
 
 class TestToolLogging:
     """Test tool transparency logging functionality"""
     
     def test_logging_enabled_by_default(self):
         """Test: Tool logging should be enabled by default"""
-        default_value = os.getenv("MQ_SHOW_TOOL_LOGGING", "true")
-        assert default_value.lower() == "true"
+        assert MQ_SHOW_TOOL_LOGGING is True
     
     def test_logging_can_be_disabled(self):
         """Test: Tool logging can be disabled via environment"""
@@ -28,11 +41,9 @@ class TestToolLogging:
     
     def test_tool_logger_displays_arguments(self):
         """Test: Tool logger should display tool arguments"""
-        args = {"qmgr_name": "MQQMGR1", "mqsc_command": "DISPLAY QLOCAL(*)"}
-        
-        assert "qmgr_name" in args
-        assert "mqsc_command" in args
-        assert args["qmgr_name"] == "MQQMGR1"
+        assert "qmgr_name" in _ARGS
+        assert "mqsc_command" in _ARGS
+        assert _ARGS["qmgr_name"] == "MQQMGR1"
     
     def test_tool_logger_displays_rest_endpoint(self):
         """Test: Tool logger should display REST API endpoint"""
@@ -40,82 +51,54 @@ class TestToolLogging:
         qmgr_name = "MQQMGR1"
         
         # Expected URL format
-        expected_url = f"https://{qmgr_name}:9443/ibmmq/rest/v3/admin/action/qmgr/{qmgr_name}/mqsc"
+        expected_url = MQSC_URL_TMPL.format_map({"qm": qmgr_name})
         
         assert qmgr_name in expected_url
         assert "mqsc" in expected_url
 
 class TestRESTEndpointConstruction:
     """Test REST API endpoint URL construction"""
-    
-    def test_dspmq_endpoint(self):
-        """Test: dspmq REST endpoint construction"""
-        base_url = "https://localhost:9443/ibmmq/rest/v3/admin/"
-        tool_name = "dspmq"
-        expected_endpoint = f"{base_url}qmgr/"
-        
-        assert "qmgr/" in expected_endpoint
-    
-    def test_dspmqver_endpoint(self):
-        """Test: dspmqver REST endpoint construction"""
-        base_url = "https://localhost:9443/ibmmq/rest/v3/admin/"
-        tool_name = "dspmqver"
-        expected_endpoint = f"{base_url}installation"
-        
-        assert "installation" in expected_endpoint
-    
-    def test_runmqsc_endpoint_dynamic_hostname(self):
-        """Test: runmqsc should use queue manager name as hostname"""
-        base_url = "https://localhost:9443/ibmmq/rest/v3/admin/"
-        qmgr_name = "MQQMGR1"
-        
-        # Replace localhost with queue manager name
-        url_with_qmgr = base_url.replace('localhost', qmgr_name)
-        expected_endpoint = f"{url_with_qmgr}action/qmgr/{qmgr_name}/mqsc"
-        
-        assert qmgr_name in expected_endpoint
-        assert "localhost" not in expected_endpoint
-        assert f"https://{qmgr_name}" in expected_endpoint
-    
-    def test_find_mq_object_endpoint(self):
-        """Test: find_mq_object shows CSV file path"""
-        tool_name = "find_mq_object"
-        expected_endpoint = "[CSV File] resources/qmgr_dump.csv"
-        
-        assert "CSV" in expected_endpoint
-        assert "qmgr_dump.csv" in expected_endpoint
+
+    # Per-tool endpoint builders, mirroring tool_logger's dispatch
+    _BUILDERS = {
+        "dspmq": lambda qm: f"{BASE_URL}qmgr/",
+        "dspmqver": lambda qm: f"{BASE_URL}installation",
+        "runmqsc": lambda qm: MQSC_URL_TMPL.format_map({"qm": qm}),
+        "find_mq_object": lambda qm: "[CSV File] resources/qmgr_dump.csv",
+    }
+
+    @pytest.mark.parametrize(
+        "tool,qmgr,needles",
+        [
+            ("dspmq", "localhost", ["qmgr/"]),
+            ("dspmqver", "localhost", ["installation"]),
+            ("runmqsc", "MQQMGR1", ["MQQMGR1", "mqsc", "https://MQQMGR1"]),
+            ("find_mq_object", "-", ["CSV", "qmgr_dump.csv"]),
+        ],
+    )
+    def test_endpoint_construction(self, tool, qmgr, needles):
+        """Each tool's endpoint contains its identifying fragments"""
+        endpoint = self._BUILDERS[tool](qmgr)
+        for needle in needles:
+            assert needle in endpoint
+        if tool == "runmqsc":
+            # The dynamic-hostname case must swap localhost out entirely
+            assert "localhost" not in endpoint
 
 class TestToolLoggingInStreamlitApps:
     """Test tool logging integration in Streamlit apps"""
-    
-    def test_basic_client_has_logging(self):
-        """Test: streamlit_basic_client shows tool calls"""
-        has_tool_logger_import = True
-        has_display_call = True
-        
-        assert has_tool_logger_import
-        assert has_display_call
-    
-    def test_guided_client_has_logging(self):
-        """Test: streamlit_guided_client shows tool calls"""
-        has_tool_logger_import = True
-        has_display_call = True
-        
-        assert has_tool_logger_import
-        assert has_display_call
-    
-    def test_openai_client_shows_rest_endpoints(self):
-        """Test: streamlit_openai_client shows REST endpoints"""
-        has_rest_endpoint_display = True
-        shows_in_expandable = True
-        
-        assert has_rest_endpoint_display
-        assert shows_in_expandable
-    
-    def test_remote_client_shows_rest_endpoints(self):
-        """Test: streamlit_remote_client shows REST endpoints"""
-        has_rest_endpoint_display = True
-        shows_in_expandable = True
-        
-        assert has_rest_endpoint_display
-        assert shows_in_expandable
+
+    @pytest.mark.parametrize(
+        "client,flags",
+        [
+            ("basic", ("has_tool_logger_import", "has_display_call")),
+            ("guided", ("has_tool_logger_import", "has_display_call")),
+            ("openai", ("has_rest_endpoint_display", "shows_in_expandable")),
+            ("remote", ("has_rest_endpoint_display", "shows_in_expandable")),
+        ],
+    )
+    def test_logging_integration(self, client, flags):
+        """Each Streamlit client surfaces its tool calls / REST endpoints"""
+        # Placeholder expectations carried over from the per-client tests
+        expectations = dict.fromkeys(flags, True)
+        assert all(expectations.values()), f"streamlit_{client}_client logging flags"